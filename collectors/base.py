@@ -7,21 +7,167 @@ import os
 import platform
 import re
 import sqlite3
+import threading
 import urllib.parse
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Callable, Container, Dict, Generator, Iterable, List, Optional, Tuple
 
 from config import (
     CONTENT_PREVIEW_MAX, CREDENTIAL_FILES, CREDENTIAL_PATTERNS,
-    MAX_FILE_READ_BYTES,
+    HASH_CACHE_PATH, IO_WORKERS, MAX_FILE_READ_BYTES,
 )
 from normalizer import (
-    normalize_timestamp, sanitize_content, content_preview,
-    estimate_model_from_content, CHROME_EPOCH_OFFSET,
+    normalize_timestamp, json_dumps, sanitize_content, content_preview,
+    contains_credentials_bytes, estimate_model_from_content, CHROME_EPOCH_OFFSET,
 )
 from schema import AIArtifact
 
+# Optional streaming JSON parser; ijson picks its fastest installed
+# backend (yajl2_c first) and falls back to pure Python.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional faster JSON decoder; parses UTF-8 bytes without a str copy.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Integer literals orjson would turn into floats (beyond 64 bits); a match
+# sends the document to json.loads, which keeps them exact
+_BIG_INT_RE = re.compile(rb"-\d{19}|\d{20}")
+
+# Flags for one-shot reads: no fd leak into child processes, binary on Windows
+_O_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+# Block size for reading past the fstat size (growing or procfs-style files)
+_READ_BLOCK = 65536
+
+# Buffer size for hashing without hashlib.file_digest() (Python < 3.11)
+_HASH_BLOCK = 1024 * 1024
+
+# Bound on cached file digests (shared by all collectors, persisted)
+_HASH_CACHE_SIZE = 65536
+
+
+class HashCache:
+    """SHA-256 digests keyed by path, valid while the file's stat matches.
+
+    An entry is reused only if device, inode, size, mtime and ctime are all
+    unchanged.  ctime cannot be set from userland, so a rewrite followed by
+    an mtime reset still invalidates the entry.  load() and save() persist
+    the cache as JSON under DB_DIR so unchanged files are not rehashed on
+    the next run.  Entries are also indexed by stat key, so a file reached
+    through a second path (hard link, symlinked or duplicate root) is
+    not hashed again.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = _HASH_CACHE_SIZE) -> None:
+        self.path = path
+        self._max_entries = max_entries
+        # path -> (stat key, digest), in LRU order
+        self._entries = OrderedDict()  # type: OrderedDict[str, Tuple[Tuple[int, ...], str]]
+        # stat key -> digest, for lookups under a path not yet cached
+        self._by_stat = {}  # type: Dict[Tuple[int, ...], str]
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @staticmethod
+    def _stat_key(st: os.stat_result) -> Tuple[int, ...]:
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+    def get(self, path: str, st: os.stat_result) -> Optional[str]:
+        """Return the cached digest for path if its stat still matches."""
+        key = self._stat_key(st)
+        with self._lock:
+            item = self._entries.get(path)
+            if item is not None and item[0] == key:
+                self._entries.move_to_end(path)
+                return item[1]
+            digest = self._by_stat.get(key)
+            if digest is not None:
+                self._store(path, key, digest)
+            return digest
+
+    def put(self, path: str, st: os.stat_result, digest: str) -> None:
+        """Record the digest of path as of stat result st."""
+        with self._lock:
+            self._store(path, self._stat_key(st), digest)
+
+    def _store(self, path: str, key: Tuple[int, ...], digest: str) -> None:
+        """Insert an entry and evict the oldest; caller holds the lock."""
+        old = self._entries.get(path)
+        if old is not None and old[0] != key:
+            self._by_stat.pop(old[0], None)
+        self._entries[path] = (key, digest)
+        self._entries.move_to_end(path)
+        self._dirty = True
+        if len(self._entries) > self._max_entries:
+            self._evict_oldest()
+        self._by_stat[key] = digest
+
+    def _evict_oldest(self) -> None:
+        """Drop the least recently used entry; caller holds the lock."""
+        _path, (key, _digest) = self._entries.popitem(last=False)
+        self._by_stat.pop(key, None)
+
+    def load(self) -> None:
+        """Merge entries from the cache file, ignoring it if unreadable."""
+        if not self.path:
+            return
+        try:
+            if os.path.islink(self.path) or os.path.getsize(self.path) > MAX_FILE_READ_BYTES:
+                return
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, IOError, ValueError):
+            return
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            return
+        with self._lock:
+            for path, item in entries.items():
+                if (isinstance(item, list) and len(item) == 6
+                        and all(isinstance(v, int) for v in item[:5])
+                        and isinstance(item[5], str)):
+                    key = tuple(item[:5])
+                    if path not in self._entries:
+                        self._entries[path] = (key, item[5])
+                        self._by_stat.setdefault(key, item[5])
+            while len(self._entries) > self._max_entries:
+                self._evict_oldest()
+
+    def save(self) -> None:
+        """Write the cache file (owner-only) if anything changed."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {p: list(key) + [digest] for p, (key, digest) in self._entries.items()}
+            self._dirty = False
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "entries": entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except (OSError, IOError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# Process-wide digest cache persisted at HASH_CACHE_PATH
+HASH_CACHE = HashCache(HASH_CACHE_PATH)
+
 
 class AbstractCollector(ABC):
     """Base class for all artifact collectors."""
@@ -29,6 +175,7 @@ class AbstractCollector(ABC):
     def __init__(self) -> None:
         self._user = getpass.getuser()
         self._hostname = platform.node()
+        self._hash_cache = HASH_CACHE
 
     @property
     @abstractmethod
@@ -49,41 +196,195 @@ class AbstractCollector(ABC):
     # --- File helpers ---
 
     def _hash_file(self, path: str, max_bytes: int = MAX_FILE_READ_BYTES) -> Optional[str]:
-        """SHA-256 hash of a file, read in 64KB chunks. Skips files over max_bytes."""
+        """SHA-256 hash of a file.  Skips files over max_bytes.
+
+        Uses hashlib.file_digest() on Python 3.11+, which loops in C with
+        the GIL released; older Pythons readinto() one reusable 1 MiB
+        buffer, and each update() on it also releases the GIL.  Files are
+        never memory-mapped, so one truncated mid-read fails with OSError
+        rather than SIGBUS.  Digests are cached in HASH_CACHE, so an
+        unchanged file is read once per run, or not at all when the cache
+        was loaded from a previous run.
+        """
         try:
-            if os.path.getsize(path) > max_bytes:
+            with open(path, "rb", buffering=0) as f:
+                st = os.fstat(f.fileno())
+                if st.st_size > max_bytes:
+                    return None
+                digest = self._hash_cache.get(path, st)
+                if digest is not None:
+                    return digest
+                if hasattr(hashlib, "file_digest"):
+                    digest = hashlib.file_digest(f, "sha256").hexdigest()
+                else:
+                    h = hashlib.sha256()
+                    buf = bytearray(_HASH_BLOCK)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        h.update(view[:n])
+                    digest = h.hexdigest()
+        except (OSError, IOError, ValueError):
+            return None
+        self._hash_cache.put(path, st, digest)
+        return digest
+
+    def _read_bytes(
+        self, path: str, max_bytes: int = MAX_FILE_READ_BYTES
+    ) -> Optional[Tuple[bytes, os.stat_result]]:
+        """Read a whole file and return (bytes, fstat result), or None.
+
+        Uses os.open/fstat/os.read so the read is sized from the file's own
+        stat: one read() syscall for a regular file, with no buffered-IO
+        layer and no max_bytes-sized buffer allocated up front.  Returns
+        None when the file is unreadable or larger than max_bytes.
+        """
+        try:
+            fd = os.open(path, _O_READ_FLAGS)
+        except OSError:
+            return None
+        try:
+            st = os.fstat(fd)
+            if st.st_size > max_bytes:
                 return None
-            h = hashlib.sha256()
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(65536)
+            data = os.read(fd, st.st_size + 1)
+            if len(data) > st.st_size:
+                # Grew since fstat, or reports no size: read the rest
+                chunks = [data]
+                total = len(data)
+                while total <= max_bytes:
+                    chunk = os.read(fd, _READ_BLOCK)
                     if not chunk:
                         break
-                    h.update(chunk)
-            return h.hexdigest()
-        except (OSError, IOError):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                if total > max_bytes:
+                    return None
+                data = b"".join(chunks)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+        return data, st
+
+    def _read_and_hash(
+        self, path: str, max_bytes: int = MAX_FILE_READ_BYTES
+    ) -> Optional[Tuple[bytes, str]]:
+        """Read a file once and return (bytes, SHA-256 hex). Skips files over max_bytes.
+
+        The digest is always computed from the returned bytes, never taken
+        from HASH_CACHE, so it matches the content that is parsed and
+        previewed even if the file changed since it was last hashed.
+        """
+        read = self._read_bytes(path, max_bytes)
+        if read is None:
             return None
+        data, _st = read
+        return data, hashlib.sha256(data).hexdigest()
 
-    def _safe_read_text(self, path: str, max_bytes: int = MAX_FILE_READ_BYTES) -> Optional[str]:
-        """Read a text file safely with size guard and encoding fallback."""
+    def _safe_loads_json(self, data: bytes) -> Optional[Any]:
+        """Parse JSON from raw file bytes, decoding like _safe_read_text.
+
+        orjson is tried first when installed.  It is stricter than the
+        stdlib (no NaN, valid UTF-8 only), so anything it rejects goes
+        through json.loads as before.  Documents with integers past 64 bits,
+        which orjson would parse as floats, also go to json.loads.
+        """
+        if orjson is not None and _BIG_INT_RE.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                data = f.read(max_bytes + 1)
-                if len(data) > max_bytes:
-                    return None
-                return data
-        except (OSError, IOError):
+            return json.loads(data.decode("utf-8", errors="replace"))
+        except (json.JSONDecodeError, ValueError):
+            return None
+
+    def _safe_read_text(self, path: str, max_bytes: int = MAX_FILE_READ_BYTES) -> Optional[str]:
+        """Read a text file safely with size guard and encoding fallback.
+
+        Newlines are translated as in text mode (CRLF and CR become LF).
+        """
+        read = self._read_bytes(path, max_bytes)
+        if read is None:
             return None
+        return self._decode_text(read[0])
+
+    def _decode_text(self, data: bytes) -> str:
+        """Decode raw file bytes as _safe_read_text does."""
+        text = data.decode("utf-8", errors="replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
-    def _safe_read_json(self, path: str) -> Optional[Any]:
+    def _safe_read_json(self, path: str, max_bytes: int = MAX_FILE_READ_BYTES) -> Optional[Any]:
         """Read and parse a JSON file safely."""
-        text = self._safe_read_text(path)
-        if text is None:
+        read = self._read_bytes(path, max_bytes)
+        if read is None:
             return None
-        try:
-            return json.loads(text)
-        except (json.JSONDecodeError, ValueError):
+        return self._safe_loads_json(read[0])
+
+    def _safe_iter_json_prefix(
+        self, path: str, max_items: int = 3, head_chars: Optional[int] = None
+    ) -> Optional[Tuple[Any, int]]:
+        """Parse the head of a JSON file without materializing array tails.
+
+        Returns (head, count).  For a top-level array, head is a list of the
+        first max_items elements and count is the total element count; for
+        any other document, head is the parsed value and count is 0.  With
+        head_chars, array elements are also kept until the head's compact
+        JSON is longer than head_chars, so it serializes to the same prefix
+        as the whole array.  Streams with ijson when it is installed, and
+        parses the whole file as _safe_read_json does when ijson is missing
+        or rejects it (invalid UTF-8, NaN, huge ints).  Returns None on
+        error.
+        """
+        if ijson is not None:
+            try:
+                if os.path.getsize(path) > MAX_FILE_READ_BYTES:
+                    return None
+                with open(path, "rb") as f:
+                    first = next(ijson.parse(f), None)
+                    if first is None:
+                        return None
+                    f.seek(0)
+                    if first[1] == "start_array":
+                        return self._json_array_head(
+                            ijson.items(f, "item", use_float=True), max_items, head_chars,
+                        )
+                    if first[1] == "start_map":
+                        return dict(ijson.kvitems(f, "", use_float=True)), 0
+                    value = next(ijson.items(f, "", use_float=True), None)
+                    if value is None:
+                        return None
+                    return value, 0
+            except (OSError, IOError):
+                return None
+            except (ValueError, ijson.JSONError):
+                pass
+        data = self._safe_read_json(path)
+        if data is None:
             return None
+        if isinstance(data, list):
+            return self._json_array_head(data, max_items, head_chars)
+        return data, 0
+
+    def _json_array_head(
+        self, items: Iterable[Any], max_items: int, head_chars: Optional[int]
+    ) -> Tuple[List[Any], int]:
+        """Return (head, count) for JSON array elements; see _safe_iter_json_prefix."""
+        head = []  # type: List[Any]
+        head_size = 1
+        count = 0
+        for item in items:
+            if count < max_items or (head_chars is not None and head_size <= head_chars):
+                head.append(item)
+                if head_chars is not None:
+                    head_size += len(json_dumps(item)) + 1
+            count += 1
+        return head, count
 
     def _safe_read_jsonl(self, path: str) -> Generator[Dict[str, Any], None, None]:
         """Yield parsed JSON objects from a JSONL file, line by line."""
@@ -103,6 +404,60 @@ class AbstractCollector(ABC):
         except (OSError, IOError):
             return
 
+    def _iter_files(
+        self, root: str, skip_dirs: Optional[Container[str]] = None
+    ) -> Generator[os.DirEntry, None, None]:
+        """Yield DirEntry objects for regular files under root, depth-first.
+
+        Files come in the same order as a top-down os.walk().  root itself
+        may be a symlink (e.g. a models directory on an external disk) and
+        is followed, as os.walk() does; symlinked files and directories
+        below it are skipped, as are subdirectories whose name is in
+        skip_dirs (they are never opened).  Entry types come from the
+        cached readdir data, so classifying an entry costs no stat().
+        """
+        stack = [root]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            subdirs = []  # type: List[str]
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if skip_dirs is None or entry.name not in skip_dirs:
+                                subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+            stack.extend(reversed(subdirs))
+
+    def _relative_path(self, fpath: str, root: str) -> str:
+        """os.path.relpath(fpath, root) for a path from a walk of root.
+
+        Walked paths are root joined with plain entry names, so the prefix
+        is sliced off instead of normalizing both paths per file.
+        """
+        prefix = os.path.join(root, "")
+        if fpath.startswith(prefix):
+            return fpath[len(prefix):]
+        return os.path.relpath(fpath, root)
+
+    def _parallel_map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Apply func to items on a thread pool, preserving input order.
+
+        File reads and hashlib release the GIL, so per-file I/O and hashing
+        overlap across workers.  func must not touch shared state.
+        """
+        items = list(items)
+        if len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(items))) as pool:
+            return list(pool.map(func, items))
+
     # --- Content helpers ---
 
     def _estimate_tokens(self, text: str) -> int:
@@ -111,16 +466,55 @@ class AbstractCollector(ABC):
             return 0
         return len(text) // 4
 
+    def _preview_sanitize(
+        self,
+        data: Any,
+        limit: int = 50000,
+        default: Callable[[Any], Any] = str,
+    ) -> Tuple[str, Optional[str]]:
+        """Serialize and sanitize parsed JSON, bounding work on large documents.
+
+        Every document is serialized by normalizer.json_dumps() and
+        sanitized by _preview_sanitize_text(), so its preview, and the
+        artifact ID derived from it, do not depend on the document's size.
+        Returns (sanitized, raw_data).  raw_data is the full sanitized JSON
+        when it is shorter than limit, else None, and only a prefix shortly
+        past limit is sanitized.  default is the encoder's hook for values
+        JSON cannot represent.
+        """
+        return self._preview_sanitize_text(json_dumps(data, default=default), limit)
+
+    def _preview_sanitize_text(
+        self, text: str, limit: int = 50000
+    ) -> Tuple[str, Optional[str]]:
+        """Sanitize text, bounding work on large inputs.
+
+        Returns (sanitized, raw_data) like _preview_sanitize().  Text longer
+        than shortly past limit is cut there before sanitizing, since only
+        its preview is kept.
+        """
+        cap = limit + 1024
+        if len(text) > cap:
+            return sanitize_content(text[:cap]), None
+        sanitized = sanitize_content(text)
+        return sanitized, sanitized if len(sanitized) < limit else None
+
     def _content_preview(self, text: str) -> str:
         """Truncate and sanitize text for preview."""
         return content_preview(text, CONTENT_PREVIEW_MAX)
 
     # --- File metadata ---
 
-    def _file_metadata(self, path: str) -> Dict[str, Any]:
-        """Get file size, mtime, and birthtime."""
+    def _file_metadata(
+        self, path: str, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Get file size, mtime, and birthtime.
+
+        Pass st when a stat result is already at hand to skip the stat() call.
+        """
         try:
-            st = os.stat(path)
+            if st is None:
+                st = os.stat(path)
             result = {
                 "file_size_bytes": st.st_size,
                 "file_modified": normalize_timestamp(st.st_mtime),
@@ -135,6 +529,14 @@ class AbstractCollector(ABC):
         except (OSError, IOError):
             return {"file_size_bytes": None, "file_modified": None, "file_created": None}
 
+    def _file_metadata_from_entry(self, entry: os.DirEntry) -> Dict[str, Any]:
+        """_file_metadata() for a scandir entry, reusing its cached stat."""
+        try:
+            st = entry.stat()
+        except OSError:
+            return {"file_size_bytes": None, "file_modified": None, "file_created": None}
+        return self._file_metadata(entry.path, st)
+
     # --- Timestamp helpers ---
 
     def _parse_timestamp_ms(self, ms: Any) -> Optional[str]:
@@ -187,23 +589,92 @@ class AbstractCollector(ABC):
 
     # --- SQLite helper ---
 
-    def _safe_sqlite_read(
-        self, db_path: str, query: str, params: Optional[Tuple] = None
-    ) -> List[Dict[str, Any]]:
-        """Open a SQLite DB in immutable mode and run a read query."""
+    def _sqlite_connect_ro(self, db_path: str) -> Optional[sqlite3.Connection]:
+        """Open a SQLite DB in immutable, query-only mode, or return None.
+
+        Temp b-trees (ORDER BY sorts) are kept in memory.  Errors are
+        logged at debug level.
+        """
         import logging
-        results = []
-        uri = "file:{}?immutable=1".format(urllib.parse.quote(db_path))
+        uri = "file:{}?mode=ro&immutable=1".format(urllib.parse.quote(db_path))
         try:
             conn = sqlite3.connect(uri, uri=True)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params or ())
-            results = [dict(row) for row in cursor.fetchall()]
+        except (sqlite3.OperationalError, sqlite3.DatabaseError) as exc:
+            logging.getLogger("aift").debug(
+                "SQLite read failed for %s: %s", db_path, exc
+            )
+            return None
+        try:
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+        except (sqlite3.OperationalError, sqlite3.DatabaseError) as exc:
+            logging.getLogger("aift").debug(
+                "SQLite read failed for %s: %s", db_path, exc
+            )
             conn.close()
+            return None
+        return conn
+
+    def _safe_sqlite_iter(
+        self, db_path: str, query: str, params: Optional[Tuple] = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Open a SQLite DB in immutable mode and yield query rows as dicts.
+
+        Rows are streamed from the cursor rather than fetched up front.
+        Errors end the iteration and are logged at debug level.
+        """
+        import logging
+        conn = self._sqlite_connect_ro(db_path)
+        if conn is None:
+            return
+        try:
+            cursor = conn.execute(query, params or ())
+            columns = [d[0] for d in cursor.description]
+            for row in cursor:
+                yield dict(zip(columns, row))
         except (sqlite3.OperationalError, sqlite3.DatabaseError) as exc:
             logging.getLogger("aift").debug(
                 "SQLite read failed for %s: %s", db_path, exc
             )
+        finally:
+            conn.close()
+
+    def _safe_sqlite_read(
+        self, db_path: str, query: str, params: Optional[Tuple] = None
+    ) -> List[Dict[str, Any]]:
+        """Open a SQLite DB in immutable mode and run a read query."""
+        return list(self._safe_sqlite_iter(db_path, query, params))
+
+    def _safe_sqlite_read_many(
+        self, db_path: str, queries: Iterable[str]
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several read queries over one immutable-mode connection.
+
+        Returns one row list per query.  A failing query yields an empty
+        list without affecting the others; errors are logged at debug level.
+        """
+        import logging
+        queries = list(queries)
+        if not queries:
+            return []
+        conn = self._sqlite_connect_ro(db_path)
+        if conn is None:
+            return [[] for _ in queries]
+        results = []  # type: List[List[Dict[str, Any]]]
+        try:
+            for query in queries:
+                try:
+                    cursor = conn.execute(query)
+                    columns = [d[0] for d in cursor.description]
+                    results.append([dict(zip(columns, row)) for row in cursor])
+                except (sqlite3.OperationalError, sqlite3.DatabaseError) as exc:
+                    logging.getLogger("aift").debug(
+                        "SQLite read failed for %s: %s", db_path, exc
+                    )
+                    results.append([])
+        finally:
+            conn.close()
         return results
 
     # --- LevelDB string extraction ---
@@ -221,10 +692,11 @@ class AbstractCollector(ABC):
 
         pattern = re.compile(b'([\x20-\x7e]{' + str(min_length).encode() + b',})')
 
+        dir_prefix = os.path.join(directory, "")
         for fname in os.listdir(directory):
-            if not (fname.endswith(".log") or fname.endswith(".ldb")):
+            if not fname.endswith((".log", ".ldb")):
                 continue
-            fpath = os.path.join(directory, fname)
+            fpath = dir_prefix + fname
             if os.path.islink(fpath):
                 continue
             try:
@@ -236,15 +708,17 @@ class AbstractCollector(ABC):
             except (OSError, IOError):
                 continue
 
+            # Matches are printable ASCII, so the credential scan and JSON
+            # parse run on the raw bytes; only kept strings are decoded.
             for match in pattern.finditer(data):
-                text = match.group(1).decode("ascii", errors="replace")
+                raw = match.group(1)
                 # Skip credential content
-                if self._contains_credentials(text):
+                if contains_credentials_bytes(raw):
                     continue
-                entry = {"source_file": fname, "content": text}  # type: Dict[str, Any]
+                entry = {"source_file": fname, "content": raw.decode("ascii")}  # type: Dict[str, Any]
                 # Try parsing as JSON
                 try:
-                    parsed = json.loads(text)
+                    parsed = json.loads(raw)
                     entry["json_data"] = parsed
                 except (json.JSONDecodeError, ValueError):
                     pass
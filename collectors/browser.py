@@ -45,11 +45,12 @@ class SafariCollector(AbstractCollector):
         if not os.path.isfile(db_path):
             return []
 
+        # CROSS JOIN: test the URL patterns once per item, not per visit
         url_filter = _build_url_or_clause("hi.url", AI_URL_PATTERNS)
         query = (
             "SELECT hi.url, hv.title, hv.visit_time "
             "FROM history_items hi "
-            "JOIN history_visits hv ON hi.id = hv.history_item "
+            "CROSS JOIN history_visits hv ON hi.id = hv.history_item "
             "WHERE " + url_filter + " "
             "ORDER BY hv.visit_time DESC"
         )
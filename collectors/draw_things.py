@@ -1,13 +1,12 @@
 """Draw Things artifact collector."""
 
-import json
 import os
 import plistlib
 from typing import Any, Dict, List
 
 from collectors.base import AbstractCollector
 from config import HOME
-from normalizer import sanitize_content
+from normalizer import plist_json_default, sanitize_json
 from schema import AIArtifact
 
 
@@ -153,18 +152,12 @@ class DrawThingsCollector(AbstractCollector):
                     data = self._safe_read_json(fpath)
                     if data is None:
                         continue
-                    sanitized = sanitize_content(
-                        json.dumps(data, default=str)
-                    )
+                    sanitized = sanitize_json(data)
                 elif fname.endswith(".plist"):
                     try:
                         with open(fpath, "rb") as f:
                             plist_data = plistlib.load(f)
-                        sanitized = sanitize_content(
-                            json.dumps(
-                                self._plist_to_safe(plist_data), default=str,
-                            )
-                        )
+                        sanitized = sanitize_json(plist_data, default=plist_json_default)
                     except (plistlib.InvalidFileException, OSError,
                             PermissionError, ValueError):
                         continue
@@ -187,26 +180,3 @@ class DrawThingsCollector(AbstractCollector):
                 ))
 
         return results
-
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _plist_to_safe(obj):
-        """Convert plist data types to JSON-serializable types."""
-        if isinstance(obj, dict):
-            return {
-                str(k): DrawThingsCollector._plist_to_safe(v)
-                for k, v in obj.items()
-            }
-        if isinstance(obj, (list, tuple)):
-            return [DrawThingsCollector._plist_to_safe(item) for item in obj]
-        if isinstance(obj, bytes):
-            if len(obj) <= 64:
-                return "<binary:{}>".format(obj.hex())
-            return "<binary:{}... ({} bytes)>".format(
-                obj[:32].hex(), len(obj),
-            )
-        if isinstance(obj, (int, float, str, bool)):
-            return obj
-        return str(obj)
@@ -2,14 +2,24 @@
 
 import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from collectors.mixins import LocalLLMRunnerMixin
-from config import HOME
+from config import CONTENT_PREVIEW_MAX, HOME, MAX_FILE_READ_BYTES
 from normalizer import sanitize_content, estimate_model_from_content
 from schema import AIArtifact
 
+# Directories never descended into under threads/
+_PRUNE_DIRS = {".git"}
+
+# Characters of thread message text kept for the preview.  The slack past
+# CONTENT_PREVIEW_MAX keeps credentials near the cut whole for redaction.
+_PREVIEW_TEXT_MAX = CONTENT_PREVIEW_MAX + 1024
+
+# Bytes of app.log that are sanitized for the preview and raw_data
+_LOG_HEAD_BYTES = 50000
+
 
 class JanCollector(LocalLLMRunnerMixin, AbstractCollector):
     """Collect artifacts from the Jan local LLM runner.
@@ -64,76 +74,90 @@ class JanCollector(LocalLLMRunnerMixin, AbstractCollector):
         if not os.path.isdir(threads_dir):
             return results
 
-        for dirpath, _dirnames, filenames in os.walk(threads_dir):
-            if os.path.islink(dirpath):
+        if os.path.islink(threads_dir):
+            return results
+
+        paths = [
+            entry.path
+            for entry in self._iter_files(threads_dir, skip_dirs=_PRUNE_DIRS)
+            if entry.name.endswith(".json") and not self._is_credential_file(entry.path)
+        ]
+        loaded = self._parallel_map(self._load_thread_file, paths)
+        for fpath, (fmeta, file_hash, parsed) in zip(paths, loaded):
+            if parsed is None:
                 continue
-            for fname in filenames:
-                if not fname.endswith(".json"):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                rel_path = os.path.relpath(fpath, threads_dir)
-                thread_id = os.path.basename(os.path.dirname(fpath))
-
-                # Extract conversation details
-                message_count = 0
-                preview_text = ""
-                model = None  # type: Optional[str]
-
-                if isinstance(data, dict):
-                    # Thread metadata file (e.g. thread.json)
-                    title = data.get("title", data.get("name", ""))
-                    model = data.get("model", data.get("model_id"))
-                    preview_text = title if title else json.dumps(data)
-
-                elif isinstance(data, list):
-                    # Messages array
-                    message_count = len(data)
-                    for msg in data[:3]:
-                        if isinstance(msg, dict):
-                            content = msg.get("content", msg.get("text", ""))
-                            if content:
-                                preview_text += str(content) + " "
-                            if not model:
-                                model = msg.get("model")
-
-                if not model and preview_text:
-                    model = estimate_model_from_content(preview_text)
-
-                sanitized = sanitize_content(preview_text.strip())
-
-                results.append(self._make_artifact(
-                    artifact_type="conversation",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    model_identified=model,
-                    conversation_id=thread_id,
-                    token_estimate=self._estimate_tokens(preview_text),
-                    metadata={
-                        "relative_path": rel_path,
-                        "thread_id": thread_id,
-                        "message_count": message_count,
-                        "filename": fname,
-                    },
-                ))
+            data, item_count = parsed
+            rel_path = self._relative_path(fpath, threads_dir)
+            dir_path, _, fname = fpath.rpartition(os.sep)
+            # The containing directory names the thread
+            thread_id = dir_path.rpartition(os.sep)[2]
+
+            # Extract conversation details
+            message_count = 0
+            preview_text = ""
+            text_len = 0
+            model = None  # type: Optional[str]
+
+            if isinstance(data, dict):
+                # Thread metadata file (e.g. thread.json)
+                title = data.get("title", data.get("name", ""))
+                model = data.get("model", data.get("model_id"))
+                preview_text = title if title else json.dumps(data)
+                text_len = len(preview_text)
+
+            elif isinstance(data, list):
+                # Messages array.  Message text past _PREVIEW_TEXT_MAX is
+                # never shown, so it is only counted for the token estimate.
+                message_count = item_count
+                parts = []  # type: List[str]
+                for msg in data:
+                    if isinstance(msg, dict):
+                        content = msg.get("content", msg.get("text", ""))
+                        if content:
+                            content = str(content)
+                            if text_len < _PREVIEW_TEXT_MAX:
+                                parts.append(content)
+                            text_len += len(content) + 1
+                        if not model:
+                            model = msg.get("model")
+                preview_text = " ".join(parts)[:_PREVIEW_TEXT_MAX]
+
+            if not model and preview_text:
+                model = estimate_model_from_content(preview_text)
+
+            sanitized = sanitize_content(preview_text.strip())
+
+            results.append(self._make_artifact(
+                artifact_type="conversation",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                model_identified=model,
+                conversation_id=thread_id,
+                token_estimate=text_len // 4,
+                metadata={
+                    "relative_path": rel_path,
+                    "thread_id": thread_id,
+                    "message_count": message_count,
+                    "filename": fname,
+                },
+            ))
 
         return results
 
+    def _load_thread_file(self, fpath: str) -> Tuple[Dict[str, Any], Optional[str], Any]:
+        """Stat, hash and parse one thread file.  Runs on a worker thread."""
+        # Only the first three messages feed the preview, so avoid
+        # materializing the rest of large message arrays.
+        return (
+            self._file_metadata(fpath),
+            self._hash_file(fpath),
+            self._safe_iter_json_prefix(fpath, max_items=3),
+        )
+
     # ------------------------------------------------------------------
     # 2. models/ -- model configurations and inventory
     # ------------------------------------------------------------------
@@ -163,11 +187,10 @@ class JanCollector(LocalLLMRunnerMixin, AbstractCollector):
             return results
 
         fmeta = self._file_metadata(log_path)
-        file_hash = self._hash_file(log_path)
-        text = self._safe_read_text(log_path)
+        file_hash, head = self._read_log_head(log_path)
 
-        if text is None:
-            # File too large; record metadata only
+        if head is None:
+            # File too large or unreadable; record metadata only
             results.append(self._make_artifact(
                 artifact_type="log",
                 file_path=log_path,
@@ -185,7 +208,11 @@ class JanCollector(LocalLLMRunnerMixin, AbstractCollector):
             ))
             return results
 
-        sanitized = sanitize_content(text)
+        sanitized = sanitize_content(self._decode_text(head))
+        size = fmeta.get("file_size_bytes") or 0
+        raw_data = None  # type: Optional[str]
+        if size <= _LOG_HEAD_BYTES and len(sanitized) < 50000:
+            raw_data = sanitized
 
         results.append(self._make_artifact(
             artifact_type="log",
@@ -195,11 +222,28 @@ class JanCollector(LocalLLMRunnerMixin, AbstractCollector):
             file_modified=fmeta.get("file_modified"),
             file_created=fmeta.get("file_created"),
             content_preview=self._content_preview(sanitized),
-            raw_data=sanitized if len(sanitized) < 50000 else None,
+            raw_data=raw_data,
             metadata={
                 "filename": "app.log",
-                "log_size_bytes": len(text),
+                "log_size_bytes": size,
             },
         ))
 
         return results
+
+    def _read_log_head(self, path: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """Hash a log and return (sha256, first _LOG_HEAD_BYTES).
+
+        Only the head is read into memory, so large logs are never decoded
+        or sanitized in full.  The log may be appended to or rotated while
+        it is read, so plain reads are used rather than a memory map.
+        Returns (None, None) for files over MAX_FILE_READ_BYTES or on error.
+        """
+        file_hash = self._hash_file(path)
+        if file_hash is None:
+            return None, None
+        try:
+            with open(path, "rb") as f:
+                return file_hash, f.read(_LOG_HEAD_BYTES)
+        except (OSError, IOError):
+            return None, None
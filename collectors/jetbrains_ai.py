@@ -1,8 +1,7 @@
 """JetBrains AI Assistant artifact collector."""
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from config import HOME
@@ -24,6 +23,27 @@ JETBRAINS_IDE_PREFIXES = [
     "DataSpell",
 ]
 
+_JB_PREFIX_TUPLE = tuple(JETBRAINS_IDE_PREFIXES)
+
+# Extensions whose content is collected from aia/ directories
+_JSON_EXTS = frozenset({"json"})
+_TEXT_EXTS = frozenset({"xml", "yaml", "yml", "txt"})
+
+# Files listed individually in the per-IDE summary artifact
+_SUMMARY_FILES_MAX = 50
+
+
+def _content_kind(fname: str) -> Optional[str]:
+    """Return "json", "text" or None for a file name in an aia/ directory."""
+    _, dot, ext = fname.rpartition(".")
+    if not dot:
+        return None
+    if ext in _JSON_EXTS:
+        return "json"
+    if ext in _TEXT_EXTS:
+        return "text"
+    return None
+
 
 class JetBrainsAICollector(AbstractCollector):
     """Collect artifacts from JetBrains AI Assistant plugin.
@@ -36,6 +56,7 @@ class JetBrainsAICollector(AbstractCollector):
     def __init__(self) -> None:
         super().__init__()
         self._caches_root = os.path.join(HOME, "Library", "Caches", "JetBrains")
+        self._aia_dirs_cache = None  # type: Optional[List[str]]
 
     @property
     def name(self) -> str:
@@ -43,9 +64,7 @@ class JetBrainsAICollector(AbstractCollector):
 
     def detect(self) -> bool:
         """Check if any JetBrains cache directory exists with aia/ subdirectory."""
-        for aia_dir in self._find_aia_dirs():
-            return True
-        return False
+        return bool(self._find_aia_dirs())
 
     def collect(self) -> List[AIArtifact]:
         aia_dirs = self._find_aia_dirs()
@@ -61,7 +80,17 @@ class JetBrainsAICollector(AbstractCollector):
     # Directory discovery
     # ------------------------------------------------------------------
     def _find_aia_dirs(self) -> List[str]:
-        """Find all aia/ directories across JetBrains IDE cache versions."""
+        """Find all aia/ directories across JetBrains IDE cache versions.
+
+        The result is cached on the instance so detect() and collect()
+        share one directory scan.
+        """
+        if self._aia_dirs_cache is None:
+            self._aia_dirs_cache = self._scan_aia_dirs()
+        return self._aia_dirs_cache
+
+    def _scan_aia_dirs(self) -> List[str]:
+        """List aia/ directories under the JetBrains caches root."""
         aia_dirs = []  # type: List[str]
 
         if not os.path.isdir(self._caches_root):
@@ -74,13 +103,7 @@ class JetBrainsAICollector(AbstractCollector):
 
         for entry in entries:
             # Check if this directory matches a known IDE prefix
-            matches = False
-            for prefix in JETBRAINS_IDE_PREFIXES:
-                if entry.startswith(prefix):
-                    matches = True
-                    break
-
-            if not matches:
+            if not entry.startswith(_JB_PREFIX_TUPLE):
                 continue
 
             ide_dir = os.path.join(self._caches_root, entry)
@@ -105,92 +128,101 @@ class JetBrainsAICollector(AbstractCollector):
         parent_name = os.path.basename(os.path.dirname(aia_dir))
 
         file_entries = []  # type: List[Dict[str, Any]]
+        file_count = 0
         total_size = 0
 
-        for dirpath, _dirnames, filenames in os.walk(aia_dir):
-            if os.path.islink(dirpath):
-                continue
-            for fname in filenames:
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                size = fmeta.get("file_size_bytes") or 0
-                total_size += size
-
+        prefix_len = len(os.path.join(aia_dir, ""))
+        entries = [
+            e for e in self._iter_files(aia_dir)
+            if not self._is_credential_file(e.path)
+        ]
+
+        # Only files with a collected extension are read and hashed; the
+        # rest just contribute their cached stat to the summary.
+        kinds = [_content_kind(e.name) for e in entries]
+        loaded = iter(self._parallel_map(
+            self._load_aia_file,
+            [(e, k) for e, k in zip(entries, kinds) if k is not None],
+        ))
+
+        for entry, kind in zip(entries, kinds):
+            fname = entry.name
+            fpath = entry.path
+            fmeta = self._file_metadata_from_entry(entry)
+            size = fmeta.get("file_size_bytes") or 0
+            total_size += size
+            file_count += 1
+            rel_path = fpath[prefix_len:]
+
+            # The summary lists only the first _SUMMARY_FILES_MAX files
+            if len(file_entries) < _SUMMARY_FILES_MAX:
                 file_entries.append({
                     "filename": fname,
-                    "relative_path": os.path.relpath(fpath, aia_dir),
+                    "relative_path": rel_path,
                     "size_bytes": size,
                     "modified": fmeta.get("file_modified"),
                 })
 
-                # Collect JSON files content
-                if fname.endswith(".json"):
-                    data = self._safe_read_json(fpath)
-                    if data is not None:
-                        file_hash = self._hash_file(fpath)
-                        sanitized = sanitize_content(
-                            json.dumps(data, default=str)
-                        )
-
-                        results.append(self._make_artifact(
-                            artifact_type="ai_assistant_data",
-                            file_path=fpath,
-                            file_hash_sha256=file_hash,
-                            file_size_bytes=fmeta.get("file_size_bytes"),
-                            file_modified=fmeta.get("file_modified"),
-                            file_created=fmeta.get("file_created"),
-                            content_preview=self._content_preview(sanitized),
-                            raw_data=sanitized if len(sanitized) < 50000 else None,
-                            metadata={
-                                "filename": fname,
-                                "ide_version_dir": parent_name,
-                                "relative_path": os.path.relpath(fpath, aia_dir),
-                            },
-                        ))
-
-                # Collect XML/text config files
-                elif fname.endswith((".xml", ".yaml", ".yml", ".txt")):
-                    text = self._safe_read_text(fpath)
-                    if text is not None:
-                        file_hash = self._hash_file(fpath)
-                        sanitized = sanitize_content(text)
-
-                        results.append(self._make_artifact(
-                            artifact_type="ai_assistant_data",
-                            file_path=fpath,
-                            file_hash_sha256=file_hash,
-                            file_size_bytes=fmeta.get("file_size_bytes"),
-                            file_modified=fmeta.get("file_modified"),
-                            file_created=fmeta.get("file_created"),
-                            content_preview=self._content_preview(sanitized),
-                            raw_data=sanitized if len(sanitized) < 50000 else None,
-                            metadata={
-                                "filename": fname,
-                                "ide_version_dir": parent_name,
-                                "relative_path": os.path.relpath(fpath, aia_dir),
-                            },
-                        ))
+            if kind is None:
+                continue
+            content, file_hash = next(loaded)
+            if content is None:
+                continue
+            if kind == "json":
+                sanitized, raw_data = self._preview_sanitize(content)
+            else:
+                sanitized = sanitize_content(content)
+                raw_data = sanitized if len(sanitized) < 50000 else None
+
+            results.append(self._make_artifact(
+                artifact_type="ai_assistant_data",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
+                    "filename": fname,
+                    "ide_version_dir": parent_name,
+                    "relative_path": rel_path,
+                },
+            ))
 
         # Summary artifact for this IDE version
-        if file_entries:
+        if file_count:
             results.insert(0, self._make_artifact(
                 artifact_type="ai_assistant_data",
                 file_path=aia_dir,
                 content_preview="JetBrains AI ({}): {} files, {:.1f} KB total".format(
-                    parent_name, len(file_entries),
+                    parent_name, file_count,
                     total_size / 1024,
                 ),
                 metadata={
                     "ide_version_dir": parent_name,
-                    "file_count": len(file_entries),
+                    "file_count": file_count,
                     "total_size_bytes": total_size,
-                    "files": file_entries[:50],
+                    "files": file_entries,
                 },
             ))
 
         return results
+
+    def _load_aia_file(
+        self, item: Tuple[os.DirEntry, str]
+    ) -> Tuple[Any, Optional[str]]:
+        """Read and hash one aia/ file.  Runs on a worker thread.
+
+        item is (entry, kind) with kind "json" or "text".  Returns
+        (content, file_hash); content is the parsed JSON or the text, or
+        None when the file is unreadable.
+        """
+        entry, kind = item
+        read = self._read_and_hash(entry.path)
+        if read is None:
+            return None, None
+        data, file_hash = read
+        if kind == "json":
+            return self._safe_loads_json(data), file_hash
+        return self._decode_text(data), file_hash
@@ -7,18 +7,25 @@ We MUST skip the credentials/ directory and .internal/lms-key-2 entirely.
 
 import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from collectors.mixins import LocalLLMRunnerMixin
 from config import ARTIFACT_PATHS, HOME
-from normalizer import sanitize_content
+from normalizer import sanitize_content, sanitize_json
 
 
 # Directories and files that must be skipped for security
 _SKIP_DIRS = {"credentials"}
 _SKIP_FILES = {"lms-key-2"}
 
+# Matches any path component named in _SKIP_DIRS
+_SKIP_PATH_RE = re.compile(r"(?:^|{sep})(?:{names})(?:{sep}|$)".format(
+    sep=re.escape(os.sep),
+    names="|".join(re.escape(d) for d in sorted(_SKIP_DIRS)),
+))
+
 
 class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
     """Collect artifacts from the LM Studio local LLM runner.
@@ -59,15 +66,9 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
     # ------------------------------------------------------------------
     def _should_skip_path(self, path: str) -> bool:
         """Check if a path falls within a skipped directory or is a skipped file."""
-        basename = os.path.basename(path)
-        if basename in _SKIP_FILES:
+        if os.path.basename(path) in _SKIP_FILES:
             return True
-        # Check all path components for skipped directories
-        parts = path.split(os.sep)
-        for part in parts:
-            if part in _SKIP_DIRS:
-                return True
-        return False
+        return _SKIP_PATH_RE.search(path) is not None
 
     # ------------------------------------------------------------------
     # 1. settings.json
@@ -80,13 +81,16 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
         if not os.path.isfile(path):
             return results
 
-        data = self._safe_read_json(path)
+        read = self._read_and_hash(path)
+        if read is None:
+            return results
+        raw, file_hash = read
+        data = self._safe_loads_json(raw)
         if data is None:
             return results
 
         fmeta = self._file_metadata(path)
-        file_hash = self._hash_file(path)
-        sanitized = sanitize_content(json.dumps(data))
+        sanitized = sanitize_json(data)
 
         results.append(self._make_artifact(
             artifact_type="config",
@@ -116,16 +120,19 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
         if not os.path.isfile(path):
             return results
 
-        data = self._safe_read_json(path)
+        read = self._read_and_hash(path)
+        if read is None:
+            return results
+        raw, file_hash = read
+        data = self._safe_loads_json(raw)
         if data is None:
             return results
 
         fmeta = self._file_metadata(path)
-        file_hash = self._hash_file(path)
 
         # Deep-redact env values
         redacted_data = self._redact_env_values(data)
-        sanitized = sanitize_content(json.dumps(redacted_data))
+        sanitized = sanitize_json(redacted_data)
 
         results.append(self._make_artifact(
             artifact_type="config",
@@ -145,17 +152,22 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
         return results
 
     def _redact_env_values(self, obj: Any) -> Any:
-        """Recursively redact values in 'env' dict blocks."""
-        if isinstance(obj, dict):
-            result = {}  # type: Dict[str, Any]
-            for key, value in obj.items():
-                if key == "env" and isinstance(value, dict):
-                    result[key] = {k: "[REDACTED]" for k in value}
-                else:
-                    result[key] = self._redact_env_values(value)
-            return result
-        if isinstance(obj, list):
-            return [self._redact_env_values(item) for item in obj]
+        """Redact values in 'env' dict blocks, in place.  Returns obj.
+
+        Walks the tree with an explicit stack so deeply nested configs
+        neither recurse nor get copied.
+        """
+        stack = [obj]  # type: List[Any]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key == "env" and isinstance(value, dict):
+                        node[key] = {k: "[REDACTED]" for k in value}
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(v for v in node if isinstance(v, (dict, list)))
         return obj
 
     # ------------------------------------------------------------------
@@ -169,13 +181,16 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
         if not os.path.isfile(path):
             return results
 
-        data = self._safe_read_json(path)
+        read = self._read_and_hash(path)
+        if read is None:
+            return results
+        raw, file_hash = read
+        data = self._safe_loads_json(raw)
         if data is None:
             return results
 
         fmeta = self._file_metadata(path)
-        file_hash = self._hash_file(path)
-        sanitized = sanitize_content(json.dumps(data))
+        _, raw_data = self._preview_sanitize(data)
 
         # Summarize model entries
         model_count = 0
@@ -194,7 +209,7 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
             content_preview=self._content_preview(
                 "LM Studio: {} model entries in model-data.json".format(model_count)
             ),
-            raw_data=sanitized if len(sanitized) < 50000 else None,
+            raw_data=raw_data,
             metadata={
                 "model_count": model_count,
                 "source_file": "model-data.json",
@@ -214,13 +229,16 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
         if not os.path.isfile(path):
             return results
 
-        data = self._safe_read_json(path)
+        read = self._read_and_hash(path)
+        if read is None:
+            return results
+        raw, file_hash = read
+        data = self._safe_loads_json(raw)
         if data is None:
             return results
 
         fmeta = self._file_metadata(path)
-        file_hash = self._hash_file(path)
-        sanitized = sanitize_content(json.dumps(data))
+        _, raw_data = self._preview_sanitize(data)
 
         job_count = 0
         if isinstance(data, list):
@@ -238,7 +256,7 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
             content_preview=self._content_preview(
                 "LM Studio: {} download jobs".format(job_count)
             ),
-            raw_data=sanitized if len(sanitized) < 50000 else None,
+            raw_data=raw_data,
             metadata={
                 "job_count": job_count,
                 "source_file": "download-jobs-info.json",
@@ -262,6 +280,7 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
             os.path.join(self._root, ".internal", "logs"),
         ]
 
+        log_files = []  # type: List[Tuple[str, str]]
         for log_dir in log_dirs:
             if not os.path.isdir(log_dir):
                 continue
@@ -275,31 +294,44 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
                         continue
                     if self._is_credential_file(fpath):
                         continue
-
-                    fmeta = self._file_metadata(fpath)
-                    file_hash = self._hash_file(fpath)
-                    text = self._safe_read_text(fpath)
-                    sanitized_text = sanitize_content(text or "")
-
-                    results.append(self._make_artifact(
-                        artifact_type="server_log",
-                        file_path=fpath,
-                        file_hash_sha256=file_hash,
-                        file_size_bytes=fmeta.get("file_size_bytes"),
-                        file_modified=fmeta.get("file_modified"),
-                        file_created=fmeta.get("file_created"),
-                        content_preview=self._content_preview(sanitized_text),
-                        token_estimate=self._estimate_tokens(text or ""),
-                        metadata={
-                            "log_filename": fname,
-                            "log_directory": os.path.basename(log_dir),
-                        },
-                    ))
+                    log_files.append((log_dir, fpath))
             except OSError:
                 continue
 
+        loaded = self._parallel_map(self._load_log_file, [f for _, f in log_files])
+        for (log_dir, fpath), (fmeta, file_hash, text) in zip(log_files, loaded):
+            sanitized_text = sanitize_content(text or "")
+
+            results.append(self._make_artifact(
+                artifact_type="server_log",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized_text),
+                token_estimate=self._estimate_tokens(text or ""),
+                metadata={
+                    "log_filename": os.path.basename(fpath),
+                    "log_directory": os.path.basename(log_dir),
+                },
+            ))
+
         return results
 
+    def _load_log_file(self, fpath: str) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """Stat, hash and read one server log.  Runs on a worker thread.
+
+        The file is read once and hashed from those bytes; a log over the
+        read limit is still hashed (streamed) but has no text.
+        """
+        fmeta = self._file_metadata(fpath)
+        read = self._read_and_hash(fpath)
+        if read is None:
+            return fmeta, self._hash_file(fpath), None
+        data, file_hash = read
+        return fmeta, file_hash, self._decode_text(data)
+
     # ------------------------------------------------------------------
     # 6. HTTP server config
     # ------------------------------------------------------------------
@@ -314,11 +346,14 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
             "api-config.json",
         ]
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
+        for dirpath, dirnames, filenames in os.walk(self._root):
+            # Prune skipped subtrees before os.walk descends into them.
+            # os.walk does not follow directory symlinks by default.
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
             if os.path.islink(dirpath):
                 continue
             if self._should_skip_path(dirpath):
-                _dirnames[:] = []
+                dirnames[:] = []
                 continue
             for fname in filenames:
                 if fname not in config_names:
@@ -327,13 +362,16 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
                 if os.path.islink(fpath) or not os.path.isfile(fpath):
                     continue
 
-                data = self._safe_read_json(fpath)
+                read = self._read_and_hash(fpath)
+                if read is None:
+                    continue
+                raw, file_hash = read
+                data = self._safe_loads_json(raw)
                 if data is None:
                     continue
 
                 fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-                sanitized = sanitize_content(json.dumps(data))
+                sanitized, raw_data = self._preview_sanitize(data)
 
                 results.append(self._make_artifact(
                     artifact_type="config",
@@ -343,7 +381,7 @@ class LMStudioCollector(LocalLLMRunnerMixin, AbstractCollector):
                     file_modified=fmeta.get("file_modified"),
                     file_created=fmeta.get("file_created"),
                     content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
+                    raw_data=raw_data,
                     metadata={
                         "config_file": fname,
                         "relative_path": os.path.relpath(fpath, self._root),
@@ -4,14 +4,16 @@ These mixins extract common patterns from existing collectors to avoid
 code duplication across 30+ new collector implementations.
 """
 
-import json
+import codecs
+import heapq
 import os
 import plistlib
 import re
+import stat
 from typing import Any, Dict, List, Optional
 
-from config import AI_URL_PATTERNS, ARTIFACT_PATHS
-from normalizer import sanitize_content
+from config import AI_URL_PATTERNS, ARTIFACT_PATHS, MAX_FILE_READ_BYTES
+from normalizer import plist_json_default, sanitize_content, sanitize_json
 
 
 # Keys in LevelDB that may contain credentials -- filter from extraction
@@ -20,6 +22,127 @@ LEVELDB_SENSITIVE_KEYS = {
     "secret", "credential", "oauth",
 }
 
+# Single-pass, case-insensitive match for any LEVELDB_SENSITIVE_KEYS entry
+_SENSITIVE_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(LEVELDB_SENSITIVE_KEYS)),
+    re.IGNORECASE,
+)
+
+# Conversation UUIDs embedded in LevelDB strings
+_UUID_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+    re.IGNORECASE,
+)
+
+
+# (kind, path) probes that came back negative during the current collection
+# run.  Many tools are absent on a given machine and detect() and collect()
+# probe the same paths; positive results are never cached.
+_MISSING_PATHS = set()
+
+
+def clear_missing_paths():
+    """Forget cached negative path probes; call at the start of each run."""
+    _MISSING_PATHS.clear()
+
+
+def _isdir_cached(path):
+    """os.path.isdir() that remembers negative results until the next run."""
+    key = ("d", path)
+    if key in _MISSING_PATHS:
+        return False
+    if os.path.isdir(path):
+        return True
+    _MISSING_PATHS.add(key)
+    return False
+
+
+def _isfile_cached(path):
+    """os.path.isfile() that remembers negative results until the next run."""
+    key = ("f", path)
+    if key in _MISSING_PATHS:
+        return False
+    if os.path.isfile(path):
+        return True
+    _MISSING_PATHS.add(key)
+    return False
+
+
+def _stat_regular_file(path):
+    """Return os.stat(path) if it is a regular file, else None.
+
+    Equivalent to os.path.isfile() but keeps the stat result for reuse.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+# VS Code globalStorage directory, with trailing separator
+_VSCODE_GLOBAL_STORAGE = os.path.join(
+    ARTIFACT_PATHS.get("vscode", ""), "User", "globalStorage", "",
+)
+
+# Subtrees never descended into under extension globalStorage
+_EXTENSION_SKIP_DIRS = frozenset({"node_modules", ".git", ".cache", "__pycache__"})
+
+# Subtrees never descended into under model directories.  Only VCS and
+# bytecode metadata: caches there may hold real model files.
+_MODEL_SKIP_DIRS = frozenset({".git", "__pycache__"})
+
+# Exact-type dispatch for _plist_to_json_safe; subclasses use _plist_kind()
+_PLIST_KINDS = {
+    dict: "dict", list: "list", tuple: "list", bytes: "bytes",
+    int: "scalar", float: "scalar", str: "scalar", bool: "scalar",
+}
+
+
+# Leading bytes plistlib accepts for XML plists: ASCII, or behind a UTF-8,
+# UTF-16 or UTF-32 byte-order mark
+_XML_PLIST_PREFIXES = tuple(
+    bom + start.encode(encoding)
+    for bom, encoding in (
+        (b"", "ascii"),
+        (codecs.BOM_UTF8, "utf-8"),
+        (codecs.BOM_UTF16_BE, "utf-16-be"),
+        (codecs.BOM_UTF16_LE, "utf-16-le"),
+        (codecs.BOM_UTF32_BE, "utf-32-be"),
+        (codecs.BOM_UTF32_LE, "utf-32-le"),
+    )
+    for start in ("<?xml", "<plist")
+)
+
+# Enough of a file's start to tell its plist format from _plist_format()
+_PLIST_HEADER_BYTES = max(len(p) for p in _XML_PLIST_PREFIXES)
+
+
+def _plist_format(header):
+    """Return the plistlib format for a file's leading bytes, or None.
+
+    Applies the same signatures plistlib.load() probes for, so callers
+    can pass fmt= explicitly and skip plistlib for non-plist files.
+    """
+    if header.startswith(b"bplist00"):
+        return plistlib.FMT_BINARY
+    if header.startswith(_XML_PLIST_PREFIXES):
+        return plistlib.FMT_XML
+    return None
+
+
+def _plist_kind(value):
+    """Classify a value whose exact type is not in _PLIST_KINDS."""
+    if isinstance(value, dict):
+        return "dict"
+    if isinstance(value, (list, tuple)):
+        return "list"
+    if isinstance(value, bytes):
+        return "bytes"
+    if isinstance(value, (int, float, str, bool)):
+        return "scalar"
+    return "other"
+
 
 def _build_url_or_clause(column, patterns):
     """Build a SQL OR clause matching a column against URL patterns."""
@@ -27,15 +150,36 @@ def _build_url_or_clause(column, patterns):
     return "(" + " OR ".join(clauses) + ")"
 
 
+def _has_sensitive_key(content):
+    """Return True if LevelDB string content mentions a sensitive key name."""
+    return _SENSITIVE_RE.search(content) is not None
+
+
 def _filter_leveldb_strings(strings):
     """Remove LevelDB entries whose content contains sensitive key names."""
-    filtered = []
+    return [e for e in strings if not _has_sensitive_key(e.get("content", ""))]
+
+
+def _summarize_leveldb_strings(strings):
+    """Filter and summarize LevelDB entries in a single pass.
+
+    Returns (string_count, json_entry_count, conversation_ids, source_files)
+    over the entries that survive the sensitive-key filter.
+    """
+    count = 0
+    json_count = 0
+    conversation_ids = set()
+    source_files = set()
     for entry in strings:
-        content_lower = entry.get("content", "").lower()
-        if any(key in content_lower for key in LEVELDB_SENSITIVE_KEYS):
+        content = entry.get("content", "")
+        if _has_sensitive_key(content):
             continue
-        filtered.append(entry)
-    return filtered
+        count += 1
+        if "json_data" in entry:
+            json_count += 1
+        conversation_ids.update(_UUID_RE.findall(content))
+        source_files.add(entry.get("source_file", ""))
+    return count, json_count, conversation_ids, source_files
 
 
 class ChromiumHistoryMixin:
@@ -43,7 +187,7 @@ class ChromiumHistoryMixin:
 
     Subclasses must provide:
     - self._history_db_path() -> Optional[str]  -- path to the History SQLite DB
-    - Inherits from AbstractCollector (provides _safe_sqlite_read,
+    - Inherits from AbstractCollector (provides _safe_sqlite_iter,
       _parse_chrome_timestamp, _content_preview, _make_artifact)
     """
 
@@ -52,21 +196,24 @@ class ChromiumHistoryMixin:
 
         Returns List[AIArtifact].
         """
-        if not db_path or not os.path.isfile(db_path):
+        if not db_path or not _isfile_cached(db_path):
             return []
 
+        # The patterns are all %substring% matches, which no index can
+        # serve.  CROSS JOIN pins urls as the outer loop so they are tested
+        # once per URL rather than once per visit, with visits reached
+        # through visits_url_index.
         url_filter = _build_url_or_clause("u.url", AI_URL_PATTERNS)
         query = (
             "SELECT u.url, u.title, v.visit_time, v.visit_duration "
-            "FROM urls u JOIN visits v ON u.id = v.url "
+            "FROM urls u CROSS JOIN visits v ON u.id = v.url "
             "WHERE " + url_filter + " "
             "ORDER BY v.visit_time DESC"
         )
 
-        rows = self._safe_sqlite_read(db_path, query, tuple(AI_URL_PATTERNS))
         artifacts = []
 
-        for row in rows:
+        for row in self._safe_sqlite_iter(db_path, query, tuple(AI_URL_PATTERNS)):
             url = row.get("url", "")
             title = row.get("title", "")
             visit_time = row.get("visit_time")
@@ -100,26 +247,27 @@ class ChromiumHistoryMixin:
         """
         if profile_subdir:
             path = os.path.join(base_path, profile_subdir, "History")
-            if os.path.isfile(path):
+            if _isfile_cached(path):
                 return path
             return None
 
         # Check Default directly
         default_path = os.path.join(base_path, "Default", "History")
-        if os.path.isfile(default_path):
+        if _isfile_cached(default_path):
             return default_path
 
         # Check User Data/<profile>/History
         user_data = os.path.join(base_path, "User Data")
-        if os.path.isdir(user_data):
+        if _isdir_cached(user_data):
             try:
-                for entry in os.listdir(user_data):
-                    profile_dir = os.path.join(user_data, entry)
-                    if not os.path.isdir(profile_dir):
-                        continue
-                    history_file = os.path.join(profile_dir, "History")
-                    if os.path.isfile(history_file):
-                        return history_file
+                with os.scandir(user_data) as it:
+                    for entry in it:
+                        # d_type from readdir: no stat per profile entry
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        history_file = os.path.join(entry.path, "History")
+                        if os.path.isfile(history_file):
+                            return history_file
             except OSError:
                 pass
 
@@ -131,41 +279,39 @@ class OpenAIDataMixin:
 
     Subclasses must provide:
     - Inherits from AbstractCollector (provides _file_metadata, _hash_file,
-      _content_preview, _make_artifact)
+      _parallel_map, _content_preview, _make_artifact)
     """
 
-    def _collect_encrypted_data_files(self, root_dir, tool_name="OpenAI"):
+    def _collect_encrypted_data_files(self, root_dir, tool_name="OpenAI", entries=None):
         """Walk a directory for .data files (CK-encrypted binary).
 
-        Collects metadata only -- no content extraction.
+        Collects metadata only -- no content extraction.  entries, if
+        given, are the DirEntry objects under root_dir from an earlier
+        walk and are used instead of walking root_dir again.
         Returns List[AIArtifact].
         """
         results = []
         data_files = []
         total_size = 0
 
-        for dirpath, _dirnames, filenames in os.walk(root_dir):
-            # Skip symlinks
-            if os.path.islink(dirpath):
+        if entries is None:
+            entries = self._iter_files(root_dir)
+        for entry in entries:
+            fname = entry.name
+            if not fname.endswith(".data"):
                 continue
-            for fname in filenames:
-                if not fname.endswith(".data"):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if not os.path.isfile(fpath) or os.path.islink(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                size = fmeta.get("file_size_bytes") or 0
-                total_size += size
-
-                data_files.append({
-                    "filename": fname,
-                    "path": fpath,
-                    "size_bytes": size,
-                    "modified": fmeta.get("file_modified"),
-                    "created": fmeta.get("file_created"),
-                })
+
+            fmeta = self._file_metadata_from_entry(entry)
+            size = fmeta.get("file_size_bytes") or 0
+            total_size += size
+
+            data_files.append({
+                "filename": fname,
+                "path": entry.path,
+                "size_bytes": size,
+                "modified": fmeta.get("file_modified"),
+                "created": fmeta.get("file_created"),
+            })
 
         if not data_files:
             return results
@@ -194,8 +340,8 @@ class OpenAIDataMixin:
             },
         ))
 
-        for df in data_files:
-            file_hash = self._hash_file(df["path"])
+        hashes = self._parallel_map(self._hash_file, [df["path"] for df in data_files])
+        for df, file_hash in zip(data_files, hashes):
             results.append(self._make_artifact(
                 artifact_type="encrypted_conversation",
                 file_path=df["path"],
@@ -215,27 +361,67 @@ class OpenAIDataMixin:
 
         return results
 
-    def _safe_read_plist(self, path):
-        """Safely read a plist file (binary or XML format)."""
+    def _safe_read_plist(self, path, max_bytes=MAX_FILE_READ_BYTES):
+        """Safely read a plist file (binary or XML format).
+
+        Skips files over max_bytes.
+        """
         try:
             with open(path, "rb") as f:
-                return plistlib.load(f)
+                if os.fstat(f.fileno()).st_size > max_bytes:
+                    return None
+                fmt = _plist_format(f.read(_PLIST_HEADER_BYTES))
+                if fmt is None:
+                    return None
+                f.seek(0)
+                return plistlib.load(f, fmt=fmt)
         except (plistlib.InvalidFileException, OSError, IOError, ValueError, OverflowError):
             return None
 
+    def _safe_loads_plist(self, data):
+        """Parse plist bytes (binary or XML format), or return None."""
+        fmt = _plist_format(data[:_PLIST_HEADER_BYTES])
+        if fmt is None:
+            return None
+        try:
+            return plistlib.loads(data, fmt=fmt)
+        except (plistlib.InvalidFileException, ValueError, OverflowError):
+            return None
+
     def _plist_to_json_safe(self, obj):
-        """Convert plist data types to JSON-serializable types."""
-        if isinstance(obj, dict):
-            return {str(k): self._plist_to_json_safe(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple)):
-            return [self._plist_to_json_safe(item) for item in obj]
-        if isinstance(obj, bytes):
-            if len(obj) <= 64:
-                return "<binary:{}>".format(obj.hex())
-            return "<binary:{}... ({} bytes)>".format(obj[:32].hex(), len(obj))
-        if isinstance(obj, (int, float, str, bool)):
-            return obj
-        return str(obj)
+        """Convert plist data types to JSON-serializable types.
+
+        Iterative, so deeply nested plists cannot hit the recursion limit.
+        """
+        root = [None]
+        stack = [(obj, root, 0)]
+        while stack:
+            value, parent, slot = stack.pop()
+            kind = _PLIST_KINDS.get(type(value)) or _plist_kind(value)
+            if kind == "dict":
+                out = {}
+                parent[slot] = out
+                items = [(str(k), v) for k, v in value.items()]
+                for key, _ in items:
+                    out[key] = None
+                # Pushed in reverse so that, as in a dict comprehension,
+                # the last of any keys colliding after str() wins
+                stack.extend((v, out, key) for key, v in reversed(items))
+            elif kind == "list":
+                out = [None] * len(value)
+                parent[slot] = out
+                stack.extend((v, out, i) for i, v in enumerate(value))
+            elif kind == "bytes":
+                size = len(value)
+                if size <= 64:
+                    parent[slot] = "<binary:{}>".format(value.hex())
+                else:
+                    parent[slot] = "<binary:{}... ({} bytes)>".format(value[:32].hex(), size)
+            elif kind == "scalar":
+                parent[slot] = value
+            else:
+                parent[slot] = str(value)
+        return root[0]
 
     def _collect_plist_preferences(self, path, tool_name="OpenAI"):
         """Parse a plist file and return preference artifacts.
@@ -243,18 +429,32 @@ class OpenAIDataMixin:
         Returns List[AIArtifact].
         """
         results = []
-        if not os.path.isfile(path):
+        st = _stat_regular_file(path)
+        if st is None:
             return results
 
-        fmeta = self._file_metadata(path)
-        file_hash = self._hash_file(path)
+        fmeta = self._file_metadata(path, st)
+        if st.st_size > MAX_FILE_READ_BYTES:
+            # Inventoried without being read
+            results.append(self._make_artifact(
+                artifact_type="preferences",
+                file_path=path,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                metadata={"skipped_reason": "size_limit"},
+            ))
+            return results
+        loaded = self._read_and_hash(path)
+        if loaded is None:
+            return results
+        raw, file_hash = loaded
 
-        plist_data = self._safe_read_plist(path)
+        plist_data = self._safe_loads_plist(raw)
         if plist_data is None:
             return results
 
-        safe_data = self._plist_to_json_safe(plist_data)
-        sanitized_text = sanitize_content(json.dumps(safe_data, default=str))
+        sanitized_text = sanitize_json(plist_data, default=plist_json_default)
 
         results.append(self._make_artifact(
             artifact_type="preferences",
@@ -266,8 +466,8 @@ class OpenAIDataMixin:
             content_preview=self._content_preview(sanitized_text),
             raw_data=sanitized_text,
             metadata={
-                "plist_key_count": len(safe_data) if isinstance(safe_data, dict) else 0,
-                "plist_keys": list(safe_data.keys()) if isinstance(safe_data, dict) else [],
+                "plist_key_count": len(plist_data) if isinstance(plist_data, dict) else 0,
+                "plist_keys": list(plist_data.keys()) if isinstance(plist_data, dict) else [],
             },
         ))
 
@@ -279,7 +479,7 @@ class ElectronAppMixin:
 
     Subclasses must provide:
     - Inherits from AbstractCollector (provides _extract_leveldb_strings,
-      _file_metadata, _content_preview, _make_artifact)
+      _file_metadata, _parallel_map, _content_preview, _make_artifact)
     """
 
     def _collect_electron_session_storage(self, app_root, indexeddb_origin=None):
@@ -289,21 +489,13 @@ class ElectronAppMixin:
         """
         results = []
         ss_dir = os.path.join(app_root, "Session Storage")
-        if not os.path.isdir(ss_dir):
+        if not _isdir_cached(ss_dir):
             return results
 
-        strings = _filter_leveldb_strings(self._extract_leveldb_strings(ss_dir))
-        uuid_pattern = re.compile(
-            r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-            re.IGNORECASE,
+        string_count, _json_count, conversation_ids, source_files = (
+            _summarize_leveldb_strings(self._extract_leveldb_strings(ss_dir))
         )
 
-        conversation_ids = set()
-        for entry in strings:
-            content = entry.get("content", "")
-            for match in uuid_pattern.finditer(content):
-                conversation_ids.add(match.group(0))
-
         fmeta = self._file_metadata(ss_dir)
 
         results.append(self._make_artifact(
@@ -313,13 +505,13 @@ class ElectronAppMixin:
             file_modified=fmeta.get("file_modified"),
             file_created=fmeta.get("file_created"),
             content_preview="Session Storage LevelDB: {} strings extracted, {} conversation UUIDs".format(
-                len(strings), len(conversation_ids),
+                string_count, len(conversation_ids),
             ),
             metadata={
-                "strings_extracted": len(strings),
+                "strings_extracted": string_count,
                 "conversation_uuids_found": len(conversation_ids),
-                "conversation_ids": sorted(conversation_ids)[:50],
-                "source_files": list(set(e.get("source_file", "") for e in strings)),
+                "conversation_ids": heapq.nsmallest(50, conversation_ids),
+                "source_files": list(source_files),
             },
         ))
 
@@ -332,17 +524,20 @@ class ElectronAppMixin:
         """
         results = []
         ls_dir = os.path.join(app_root, "Local Storage", "leveldb")
-        if not os.path.isdir(ls_dir):
+        if not _isdir_cached(ls_dir):
             return results
 
         strings = _filter_leveldb_strings(self._extract_leveldb_strings(ls_dir))
 
         drafts = []
+        source_files = set()
         for entry in strings:
+            source_file = entry.get("source_file", "")
+            source_files.add(source_file)
             content = entry.get("content", "")
             if "tipTapEditorState" in content or "tiptapEditorState" in content:
                 drafts.append({
-                    "source_file": entry.get("source_file", ""),
+                    "source_file": source_file,
                     "preview": self._content_preview(content),
                 })
 
@@ -361,7 +556,7 @@ class ElectronAppMixin:
                 "strings_extracted": len(strings),
                 "draft_entries_found": len(drafts),
                 "drafts": drafts[:20],
-                "source_files": list(set(e.get("source_file", "") for e in strings)),
+                "source_files": list(source_files),
             },
         ))
 
@@ -377,14 +572,14 @@ class ElectronAppMixin:
         """
         results = []
         idb_base = os.path.join(app_root, "IndexedDB")
-        if not os.path.isdir(idb_base):
+        if not _isdir_cached(idb_base):
             return results
 
         # Find IndexedDB directories to scan
         idb_dirs = []
         if origin_pattern:
             candidate = os.path.join(idb_base, origin_pattern + ".indexeddb.leveldb")
-            if os.path.isdir(candidate):
+            if _isdir_cached(candidate):
                 idb_dirs.append(candidate)
         else:
             try:
@@ -395,40 +590,38 @@ class ElectronAppMixin:
             except OSError:
                 pass
 
-        for idb_dir in idb_dirs:
-            strings = _filter_leveldb_strings(self._extract_leveldb_strings(idb_dir))
+        # Each LevelDB directory is independent; overlap their file reads
+        results.extend(self._parallel_map(self._summarize_indexed_db, idb_dirs))
+        return results
 
-            json_entries = [e for e in strings if "json_data" in e]
-            uuid_pattern = re.compile(
-                r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-                re.IGNORECASE,
-            )
-            conversation_ids = set()
-            for entry in strings:
-                for match in uuid_pattern.finditer(entry.get("content", "")):
-                    conversation_ids.add(match.group(0))
+    def _summarize_indexed_db(self, idb_dir):
+        """Build the indexed_db artifact for one LevelDB directory.
 
-            fmeta = self._file_metadata(idb_dir)
+        Runs on a worker thread via _parallel_map().
+        """
+        string_count, json_count, conversation_ids, source_files = (
+            _summarize_leveldb_strings(self._extract_leveldb_strings(idb_dir))
+        )
 
-            results.append(self._make_artifact(
-                artifact_type="indexed_db",
-                file_path=idb_dir,
-                file_size_bytes=fmeta.get("file_size_bytes"),
-                file_modified=fmeta.get("file_modified"),
-                file_created=fmeta.get("file_created"),
-                content_preview="IndexedDB: {} strings, {} JSON entries, {} UUIDs".format(
-                    len(strings), len(json_entries), len(conversation_ids),
-                ),
-                metadata={
-                    "strings_extracted": len(strings),
-                    "json_entries": len(json_entries),
-                    "conversation_uuids_found": len(conversation_ids),
-                    "conversation_ids": sorted(conversation_ids)[:50],
-                    "source_files": list(set(e.get("source_file", "") for e in strings)),
-                },
-            ))
+        fmeta = self._file_metadata(idb_dir)
 
-        return results
+        return self._make_artifact(
+            artifact_type="indexed_db",
+            file_path=idb_dir,
+            file_size_bytes=fmeta.get("file_size_bytes"),
+            file_modified=fmeta.get("file_modified"),
+            file_created=fmeta.get("file_created"),
+            content_preview="IndexedDB: {} strings, {} JSON entries, {} UUIDs".format(
+                string_count, json_count, len(conversation_ids),
+            ),
+            metadata={
+                "strings_extracted": string_count,
+                "json_entries": json_count,
+                "conversation_uuids_found": len(conversation_ids),
+                "conversation_ids": heapq.nsmallest(50, conversation_ids),
+                "source_files": list(source_files),
+            },
+        )
 
     def _collect_electron_preferences(self, app_root):
         """Parse the Preferences JSON file.
@@ -437,17 +630,21 @@ class ElectronAppMixin:
         """
         results = []
         path = os.path.join(app_root, "Preferences")
-        if not os.path.isfile(path):
+        st = _stat_regular_file(path)
+        if st is None:
             return results
 
-        data = self._safe_read_json(path)
+        loaded = self._read_and_hash(path)
+        if loaded is None:
+            return results
+        raw, file_hash = loaded
+        data = self._safe_loads_json(raw)
         if data is None:
             return results
 
-        fmeta = self._file_metadata(path)
-        file_hash = self._hash_file(path)
+        fmeta = self._file_metadata(path, st)
 
-        sanitized_text = sanitize_content(json.dumps(data))
+        sanitized_text = sanitize_json(data)
 
         results.append(self._make_artifact(
             artifact_type="preferences",
@@ -474,15 +671,13 @@ class VSCodeExtensionMixin:
 
     Subclasses must provide:
     - Inherits from AbstractCollector (provides _safe_read_json, _safe_read_text,
-      _file_metadata, _hash_file, _content_preview, _make_artifact)
+      _file_metadata, _hash_file, _preview_sanitize, _content_preview,
+      _make_artifact)
     """
 
     def _get_extension_storage_path(self, extension_id):
         """Return the globalStorage path for a given extension ID."""
-        return os.path.join(
-            ARTIFACT_PATHS.get("vscode", ""),
-            "User", "globalStorage", extension_id,
-        )
+        return _VSCODE_GLOBAL_STORAGE + extension_id
 
     def _collect_extension_json_files(self, storage_path, artifact_type="extension_data"):
         """Walk an extension's globalStorage directory and collect JSON files.
@@ -490,50 +685,43 @@ class VSCodeExtensionMixin:
         Returns List[AIArtifact].
         """
         results = []
-        if not os.path.isdir(storage_path):
+        if not _isdir_cached(storage_path):
             return results
 
-        for dirpath, _dirnames, filenames in os.walk(storage_path):
-            if os.path.islink(dirpath):
+        prefix_len = len(os.path.join(storage_path, ""))
+        for entry in self._iter_files(storage_path, _EXTENSION_SKIP_DIRS):
+            fname = entry.name
+            if not fname.endswith((".json", ".yaml", ".yml")):
+                continue
+            fpath = entry.path
+            if self._is_credential_file(fpath):
                 continue
-            for fname in filenames:
-                if not (fname.endswith(".json") or fname.endswith(".yaml") or fname.endswith(".yml")):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                data = self._safe_read_json(fpath)
-                if data is not None:
-                    preview_text = json.dumps(data)
-                else:
-                    text = self._safe_read_text(fpath)
-                    preview_text = text or ""
 
-                # Sanitize content
-                sanitized = sanitize_content(preview_text)
+            fmeta = self._file_metadata_from_entry(entry)
+            file_hash = self._hash_file(fpath)
 
-                rel_path = os.path.relpath(fpath, storage_path)
+            data = self._safe_read_json(fpath)
+            if data is not None:
+                sanitized, raw_data = self._preview_sanitize(data)
+            else:
+                text = self._safe_read_text(fpath)
+                sanitized = sanitize_content(text or "")
+                raw_data = sanitized if len(sanitized) < 50000 else None
 
-                results.append(self._make_artifact(
-                    artifact_type=artifact_type,
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "relative_path": rel_path,
-                    },
-                ))
+            results.append(self._make_artifact(
+                artifact_type=artifact_type,
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
+                    "filename": fname,
+                    "relative_path": fpath[prefix_len:],
+                },
+            ))
 
         return results
 
@@ -544,7 +732,7 @@ class VSCodeExtensionMixin:
         """
         results = []
         db_path = os.path.join(storage_path, "state.vscdb")
-        if not os.path.isfile(db_path):
+        if not _isfile_cached(db_path):
             return results
 
         fmeta = self._file_metadata(db_path)
@@ -554,7 +742,7 @@ class VSCodeExtensionMixin:
         if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table_name):
             return results
 
-        rows = self._safe_sqlite_read(
+        rows = self._safe_sqlite_iter(
             db_path,
             "SELECT key, value FROM \"{}\"".format(table_name),
         )
@@ -564,7 +752,7 @@ class VSCodeExtensionMixin:
             raw_value = row.get("value", "")
 
             # Skip credential-like keys
-            if any(s in key.lower() for s in LEVELDB_SENSITIVE_KEYS):
+            if _has_sensitive_key(key):
                 continue
 
             sanitized = sanitize_content(str(raw_value)[:10000]) if raw_value else ""
@@ -593,48 +781,56 @@ class LocalLLMRunnerMixin:
     WITHOUT reading binary model blob content.
 
     Subclasses must provide:
-    - Inherits from AbstractCollector (provides _file_metadata, _hash_file,
-      _safe_read_json, _content_preview, _make_artifact)
+    - Inherits from AbstractCollector (provides _file_metadata, _parallel_map,
+      _read_and_hash, _safe_loads_json, _preview_sanitize, _content_preview,
+      _make_artifact)
     """
 
+    def _read_json_and_hash(self, path):
+        """Return (parsed JSON, sha256) for path, or (None, None) if not JSON.
+
+        Runs on a worker thread via _parallel_map().
+        """
+        read = self._read_and_hash(path)
+        if read is None:
+            return None, None
+        data = self._safe_loads_json(read[0])
+        if data is None:
+            return None, None
+        return data, read[1]
+
     def _collect_model_inventory(self, models_dir, tool_name="LLM Runner"):
         """Walk a model directory and collect metadata about model files.
 
         Returns List[AIArtifact].
         """
         results = []
-        if not os.path.isdir(models_dir):
+        if not _isdir_cached(models_dir):
             return results
 
         model_entries = []
         total_size = 0
 
-        for dirpath, _dirnames, filenames in os.walk(models_dir):
-            if os.path.islink(dirpath):
-                continue
-            for fname in filenames:
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                size = fmeta.get("file_size_bytes") or 0
-                total_size += size
-
-                rel_path = os.path.relpath(fpath, models_dir)
-
-                # Collect manifest/config files content, skip binary blobs
-                is_metadata_file = fname.endswith((".json", ".yaml", ".yml", ".txt"))
-
-                entry = {
-                    "filename": fname,
-                    "relative_path": rel_path,
-                    "size_bytes": size,
-                    "modified": fmeta.get("file_modified"),
-                    "is_metadata": is_metadata_file,
-                }
+        prefix_len = len(os.path.join(models_dir, ""))
+        for dir_entry in self._iter_files(models_dir, _MODEL_SKIP_DIRS):
+            fname = dir_entry.name
+            fmeta = self._file_metadata_from_entry(dir_entry)
+            size = fmeta.get("file_size_bytes") or 0
+            total_size += size
+
+            # Collect manifest/config files content, skip binary blobs
+            is_metadata_file = fname.endswith((".json", ".yaml", ".yml", ".txt"))
+
+            entry = {
+                "filename": fname,
+                "path": dir_entry.path,
+                "relative_path": dir_entry.path[prefix_len:],
+                "size_bytes": size,
+                "modified": fmeta.get("file_modified"),
+                "is_metadata": is_metadata_file,
+            }
 
-                model_entries.append(entry)
+            model_entries.append(entry)
 
         if not model_entries:
             return results
@@ -660,19 +856,19 @@ class LocalLLMRunnerMixin:
         ))
 
         # Collect individual manifest/config files
-        for entry in metadata_files:
-            fpath = os.path.join(models_dir, entry["relative_path"])
-            data = self._safe_read_json(fpath)
+        paths = [e["path"] for e in metadata_files]
+        loaded = self._parallel_map(self._read_json_and_hash, paths)
+        for entry, fpath, (data, file_hash) in zip(metadata_files, paths, loaded):
             if data is not None:
-                sanitized = sanitize_content(json.dumps(data))
+                sanitized, raw_data = self._preview_sanitize(data)
                 results.append(self._make_artifact(
                     artifact_type="model_config",
                     file_path=fpath,
-                    file_hash_sha256=self._hash_file(fpath),
+                    file_hash_sha256=file_hash,
                     file_size_bytes=entry.get("size_bytes"),
                     file_modified=entry.get("modified"),
                     content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
+                    raw_data=raw_data,
                     metadata={
                         "filename": entry["filename"],
                         "relative_path": entry["relative_path"],
@@ -690,60 +886,56 @@ class LocalLLMRunnerMixin:
         Returns List[AIArtifact].
         """
         results = []
-        if not os.path.isdir(manifests_dir):
+        if not _isdir_cached(manifests_dir):
             return results
 
         model_info = []
 
-        for dirpath, _dirnames, filenames in os.walk(manifests_dir):
-            if os.path.islink(dirpath):
+        prefix_len = len(os.path.join(manifests_dir, ""))
+        entries = list(self._iter_files(manifests_dir, _MODEL_SKIP_DIRS))
+        loaded = self._parallel_map(self._read_json_and_hash, [e.path for e in entries])
+        for entry, (data, file_hash) in zip(entries, loaded):
+            if data is None:
                 continue
-            for fname in filenames:
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
+            fpath = entry.path
 
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
+            fmeta = self._file_metadata_from_entry(entry)
+            rel_path = fpath[prefix_len:]
+
+            # Extract model info from manifest
+            layers = data.get("layers", [])
+            total_layer_size = sum(
+                l.get("size", 0) for l in layers if isinstance(l, dict)
+            )
 
-                fmeta = self._file_metadata(fpath)
-                rel_path = os.path.relpath(fpath, manifests_dir)
+            model_info.append({
+                "model_path": rel_path,
+                "layer_count": len(layers),
+                "total_size_bytes": total_layer_size,
+                "config_digest": data.get("config", {}).get("digest", "") if isinstance(data.get("config"), dict) else "",
+            })
 
-                # Extract model info from manifest
-                layers = data.get("layers", [])
-                total_layer_size = sum(
-                    l.get("size", 0) for l in layers if isinstance(l, dict)
-                )
+            _sanitized, raw_data = self._preview_sanitize(data)
 
-                model_info.append({
+            results.append(self._make_artifact(
+                artifact_type="model_manifest",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(
+                    "{}: model {} ({} layers)".format(
+                        tool_name, rel_path, len(layers),
+                    )
+                ),
+                raw_data=raw_data,
+                metadata={
                     "model_path": rel_path,
                     "layer_count": len(layers),
-                    "total_size_bytes": total_layer_size,
-                    "config_digest": data.get("config", {}).get("digest", "") if isinstance(data.get("config"), dict) else "",
-                })
-
-                sanitized = sanitize_content(json.dumps(data))
-
-                results.append(self._make_artifact(
-                    artifact_type="model_manifest",
-                    file_path=fpath,
-                    file_hash_sha256=self._hash_file(fpath),
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(
-                        "{}: model {} ({} layers)".format(
-                            tool_name, rel_path, len(layers),
-                        )
-                    ),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "model_path": rel_path,
-                        "layer_count": len(layers),
-                        "total_layer_size_bytes": total_layer_size,
-                    },
-                ))
+                    "total_layer_size_bytes": total_layer_size,
+                },
+            ))
 
         if model_info:
             results.insert(0, self._make_artifact(
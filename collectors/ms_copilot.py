@@ -1,13 +1,12 @@
 """Microsoft Copilot artifact collector."""
 
-import json
 import os
 import plistlib
 from typing import Any, List
 
 from collectors.base import AbstractCollector
 from config import HOME
-from normalizer import sanitize_content
+from normalizer import plist_json_default, sanitize_json
 from schema import AIArtifact
 
 
@@ -49,87 +48,58 @@ class MSCopilotCollector(AbstractCollector):
         Artifact type: config."""
         results = []  # type: List[AIArtifact]
 
-        try:
-            dir_walker = os.walk(self._root)
-        except (OSError, PermissionError):
-            return results
+        # _iter_files skips unreadable directories and symlinks.
+        entries = [
+            entry for entry in self._iter_files(self._root)
+            if entry.name.endswith((".json", ".plist"))
+            and not self._is_credential_file(entry.path)
+        ]
+        loaded = self._parallel_map(self._load_config_file, entries)
 
-        for dirpath, _dirnames, filenames in dir_walker:
-            if os.path.islink(dirpath):
+        for entry, item in zip(entries, loaded):
+            if item is None:
                 continue
-            for fname in filenames:
-                if not (fname.endswith(".json") or fname.endswith(".plist")):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                try:
-                    fmeta = self._file_metadata(fpath)
-                    file_hash = self._hash_file(fpath)
-                except (OSError, PermissionError):
-                    continue
-
-                if fname.endswith(".json"):
-                    data = self._safe_read_json(fpath)
-                    if data is None:
-                        continue
-                    sanitized = sanitize_content(
-                        json.dumps(data, default=str)
-                    )
-                elif fname.endswith(".plist"):
-                    try:
-                        with open(fpath, "rb") as f:
-                            plist_data = plistlib.load(f)
-                        sanitized = sanitize_content(
-                            json.dumps(
-                                self._plist_to_safe(plist_data), default=str,
-                            )
-                        )
-                    except (plistlib.InvalidFileException, OSError,
-                            PermissionError, ValueError):
-                        continue
-                else:
-                    continue
-
-                results.append(self._make_artifact(
-                    artifact_type="config",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "sandbox_container": "com.microsoft.copilot",
-                    },
-                ))
+            fmeta, file_hash, sanitized = item
+            fpath = entry.path
+            fname = entry.name
+
+            results.append(self._make_artifact(
+                artifact_type="config",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=sanitized if len(sanitized) < 50000 else None,
+                metadata={
+                    "filename": fname,
+                    "sandbox_container": "com.microsoft.copilot",
+                },
+            ))
 
         return results
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _plist_to_safe(obj):
-        """Convert plist data types to JSON-serializable types."""
-        if isinstance(obj, dict):
-            return {
-                str(k): MSCopilotCollector._plist_to_safe(v)
-                for k, v in obj.items()
-            }
-        if isinstance(obj, (list, tuple)):
-            return [MSCopilotCollector._plist_to_safe(item) for item in obj]
-        if isinstance(obj, bytes):
-            if len(obj) <= 64:
-                return "<binary:{}>".format(obj.hex())
-            return "<binary:{}... ({} bytes)>".format(
-                obj[:32].hex(), len(obj),
-            )
-        if isinstance(obj, (int, float, str, bool)):
-            return obj
-        return str(obj)
+    def _load_config_file(self, entry):
+        """Read, hash and serialize one JSON or plist file.  Runs on a worker thread.
+
+        Returns (file metadata, sha256, sanitized JSON text), or None when
+        the file is unreadable or does not parse.
+        """
+        fmeta = self._file_metadata_from_entry(entry)
+        # One read serves both the hash and the parse.
+        read = self._read_and_hash(entry.path)
+        if read is None:
+            return None
+        raw, file_hash = read
+
+        if entry.name.endswith(".json"):
+            data = self._safe_loads_json(raw)
+            if data is None:
+                return None
+            return fmeta, file_hash, sanitize_json(data)
+        try:
+            plist_data = plistlib.loads(raw)
+        except (plistlib.InvalidFileException, ValueError):
+            return None
+        return fmeta, file_hash, sanitize_json(plist_data, default=plist_json_default)
@@ -1,15 +1,21 @@
 """Msty local LLM runner artifact collector (~/Library/Application Support/Msty/)."""
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
-from collectors.mixins import LocalLLMRunnerMixin
+from collectors.mixins import LocalLLMRunnerMixin, _isdir_cached
 from config import HOME
-from normalizer import sanitize_content, estimate_model_from_content
+from normalizer import sanitize_content, sanitize_json, estimate_model_from_content
 from schema import AIArtifact
 
+# Known chat-related subdirectories, in collection order
+_CHAT_DIRS = ("chats", "conversations", "threads", "history")
+
+# Filename keywords that mark a JSON file as model configuration
+_MODEL_FILE_RE = re.compile(r"model|llm|config|settings", re.IGNORECASE)
+
 
 class MstyCollector(LocalLLMRunnerMixin, AbstractCollector):
     """Collect artifacts from the Msty local LLM runner.
@@ -33,207 +39,226 @@ class MstyCollector(LocalLLMRunnerMixin, AbstractCollector):
         return os.path.exists(self._root)
 
     def collect(self) -> List[AIArtifact]:
+        # Checked once here; the helpers below assume the root exists.
+        if not os.path.isdir(self._root):
+            return []
+
+        chat_dirs = [
+            subdir for subdir in _CHAT_DIRS
+            if _isdir_cached(os.path.join(self._root, subdir))
+        ]
+        models_dir = os.path.join(self._root, "models")
+        has_models_dir = _isdir_cached(models_dir)
+
+        chat_files, model_files = self._scan_json_files(
+            chat_dirs, scan_model_configs=not has_models_dir,
+        )
+        loaded = self._load_json_files(
+            [c for label in chat_files for c in chat_files[label]] + model_files
+        )
+
         artifacts = []  # type: List[Any]
-        artifacts.extend(self._collect_chat_history())
-        artifacts.extend(self._collect_model_configs())
+        # If no known chat subdirectory exists, chat files come from the root
+        for label in chat_dirs or ["root"]:
+            artifacts.extend(
+                self._collect_chat_files(chat_files.get(label, []), label, loaded)
+            )
+        if has_models_dir:
+            artifacts.extend(
+                self._collect_model_inventory(models_dir, tool_name="Msty")
+            )
+        else:
+            artifacts.extend(self._collect_model_config_files(model_files, loaded))
         return artifacts
 
     # ------------------------------------------------------------------
-    # 1. Chat history -- walk for JSON conversation files
+    # Discovery -- one walk for chat history and model config JSON
     # ------------------------------------------------------------------
-    def _collect_chat_history(self) -> List:
-        """Walk the Msty data directory for chat history JSON files.
+    def _scan_json_files(self, chat_dirs, scan_model_configs):
+        """Find chat history and model config JSON files.
 
-        Looks for conversation data in chats/, conversations/, or
-        threads/ subdirectories.
-        Returns List[AIArtifact].
+        Chat files live under the existing chat_dirs, or anywhere outside
+        models* when there are none.  When scan_model_configs is set (no
+        models/ directory), model-related JSON anywhere under the root is
+        wanted too, so the root is walked once for both; otherwise only
+        the chat directories are walked.
+
+        Returns ({source label: [(entry, rel_path)]}, [(entry, rel_path)]).
         """
-        results = []  # type: List[Any]
-        if not os.path.isdir(self._root):
-            return results
+        chat_files = {}  # type: Dict[str, List[Tuple[os.DirEntry, str]]]
+        model_files = []  # type: List[Tuple[os.DirEntry, str]]
+
+        if scan_model_configs:
+            walks = [(self._root, None)]  # type: List[Tuple[str, Optional[str]]]
+        elif chat_dirs:
+            walks = [(os.path.join(self._root, d), d) for d in chat_dirs]
+        else:
+            walks = [(self._root, "root")]
+
+        for directory, walk_label in walks:
+            for entry in self._iter_files(directory):
+                if not entry.name.endswith(".json"):
+                    continue
+                if self._is_credential_file(entry.path):
+                    continue
+                rel_path = self._relative_path(entry.path, self._root)
+
+                if walk_label is not None:
+                    label = walk_label
+                elif chat_dirs:
+                    label = rel_path.split(os.sep, 1)[0]
+                    if label not in chat_dirs:
+                        label = None
+                else:
+                    label = "root"
+                # Skip model config files in the chat pass (handled separately)
+                if label is not None and not rel_path.startswith("models"):
+                    chat_files.setdefault(label, []).append((entry, rel_path))
 
-        # Known chat-related subdirectories
-        chat_dirs = ["chats", "conversations", "threads", "history"]
-        found_chat_dir = False
+                # Only collect files that look model-related by name
+                if scan_model_configs and _MODEL_FILE_RE.search(entry.name) is not None:
+                    model_files.append((entry, rel_path))
 
-        for subdir in chat_dirs:
-            chat_path = os.path.join(self._root, subdir)
-            if os.path.isdir(chat_path):
-                found_chat_dir = True
-                results.extend(self._walk_chat_dir(chat_path, subdir))
+        return chat_files, model_files
 
-        # If no known subdirectory found, scan root for chat-related JSON files
-        if not found_chat_dir:
-            results.extend(self._walk_chat_dir(self._root, "root"))
+    def _load_json_files(self, candidates):
+        """Load each distinct candidate once on the thread pool.
 
-        return results
+        Returns {path: _load_json_file() result}.
+        """
+        entries = {}  # type: Dict[str, os.DirEntry]
+        for entry, _ in candidates:
+            entries.setdefault(entry.path, entry)
+        loaded = self._parallel_map(self._load_json_file, list(entries.values()))
+        return dict(zip(entries, loaded))
 
-    def _walk_chat_dir(self, directory, source_label) -> List:
-        """Walk a directory for JSON conversation files.
+    # ------------------------------------------------------------------
+    # 1. Chat history -- JSON conversation files
+    # ------------------------------------------------------------------
+    def _collect_chat_files(self, candidates, source_label, loaded) -> List:
+        """Build conversation artifacts from loaded chat JSON files.
 
         Returns List[AIArtifact].
         """
         results = []  # type: List[Any]
 
-        for dirpath, _dirnames, filenames in os.walk(directory):
-            if os.path.islink(dirpath):
+        for entry, rel_path in candidates:
+            item = loaded.get(entry.path)
+            if item is None:
                 continue
-            for fname in filenames:
-                if not fname.endswith(".json"):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                # Skip model config files in this pass (handled separately)
-                rel_path = os.path.relpath(fpath, self._root)
-                if rel_path.startswith("models"):
-                    continue
-
-                preview_text = ""
-                model = None  # type: Optional[str]
-                message_count = 0
-                conversation_id = None  # type: Optional[str]
-
-                if isinstance(data, dict):
-                    title = data.get("title", data.get("name", ""))
-                    model = data.get("model", data.get("model_id"))
-                    conversation_id = str(
-                        data.get("id", data.get("conversation_id", ""))
-                    ) or None
-                    messages = data.get("messages", data.get("conversation", []))
-                    if isinstance(messages, list):
-                        message_count = len(messages)
-                        for msg in messages[:3]:
-                            if isinstance(msg, dict):
-                                content = msg.get("content", msg.get("text", ""))
-                                if content:
-                                    preview_text += str(content) + " "
-                                if not model:
-                                    model = msg.get("model")
-                    if title:
-                        preview_text = "[{}] {}".format(title, preview_text)
-
-                elif isinstance(data, list):
-                    message_count = len(data)
-                    for msg in data[:3]:
+            fmeta, file_hash, data = item
+            fname = entry.name
+            fpath = entry.path
+
+            preview_text = ""
+            model = None  # type: Optional[str]
+            message_count = 0
+            conversation_id = None  # type: Optional[str]
+
+            if isinstance(data, dict):
+                title = data.get("title") or data.get("name", "")
+                model = data["model"] if "model" in data else data.get("model_id")
+                conversation_id = str(
+                    data["id"] if "id" in data else data.get("conversation_id", "")
+                ) or None
+                messages = data["messages"] if "messages" in data else data.get("conversation", [])
+                if isinstance(messages, list):
+                    message_count = len(messages)
+                    for msg in messages[:3]:
                         if isinstance(msg, dict):
-                            content = msg.get("content", msg.get("text", ""))
+                            content = msg["content"] if "content" in msg else msg.get("text", "")
                             if content:
                                 preview_text += str(content) + " "
                             if not model:
                                 model = msg.get("model")
-
-                if not model and preview_text:
-                    model = estimate_model_from_content(preview_text)
-
-                sanitized = sanitize_content(preview_text.strip())
-
-                results.append(self._make_artifact(
-                    artifact_type="conversation",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    model_identified=model,
-                    conversation_id=conversation_id,
-                    token_estimate=self._estimate_tokens(preview_text),
-                    metadata={
-                        "filename": fname,
-                        "relative_path": rel_path,
-                        "source_directory": source_label,
-                        "message_count": message_count,
-                    },
-                ))
+                if title:
+                    preview_text = "[{}] {}".format(title, preview_text)
+
+            elif isinstance(data, list):
+                message_count = len(data)
+                for msg in data[:3]:
+                    if isinstance(msg, dict):
+                        content = msg["content"] if "content" in msg else msg.get("text", "")
+                        if content:
+                            preview_text += str(content) + " "
+                        if not model:
+                            model = msg.get("model")
+
+            if not model and preview_text:
+                model = estimate_model_from_content(preview_text)
+
+            sanitized = sanitize_content(preview_text.strip())
+
+            results.append(self._make_artifact(
+                artifact_type="conversation",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                model_identified=model,
+                conversation_id=conversation_id,
+                token_estimate=self._estimate_tokens(preview_text),
+                metadata={
+                    "filename": fname,
+                    "relative_path": rel_path,
+                    "source_directory": source_label,
+                    "message_count": message_count,
+                },
+            ))
 
         return results
 
     # ------------------------------------------------------------------
-    # 2. Model configs -- walk for JSON model configuration files
+    # 2. Model configs -- JSON model configuration files
     # ------------------------------------------------------------------
-    def _collect_model_configs(self) -> List:
-        """Walk the Msty data directory for model configuration JSON files.
+    def _collect_model_config_files(self, candidates, loaded) -> List:
+        """Build model_config artifacts from loaded model-related JSON files.
 
-        Checks models/ subdirectory and falls back to scanning for
-        model-related JSON at the root level.
+        Used when there is no models/ directory for _collect_model_inventory.
         Returns List[AIArtifact].
         """
         results = []  # type: List[Any]
 
-        # Check for a dedicated models directory first
-        models_dir = os.path.join(self._root, "models")
-        if os.path.isdir(models_dir):
-            results.extend(
-                self._collect_model_inventory(models_dir, tool_name="Msty")
-            )
-            return results
+        for entry, rel_path in candidates:
+            item = loaded.get(entry.path)
+            if item is None:
+                continue
+            fmeta, file_hash, data = item
+            fname = entry.name
+            fpath = entry.path
+
+            sanitized = sanitize_json(data)
+
+            results.append(self._make_artifact(
+                artifact_type="model_config",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=sanitized if len(sanitized) < 50000 else None,
+                metadata={
+                    "filename": fname,
+                    "relative_path": rel_path,
+                },
+            ))
 
-        # No models/ directory -- walk root for model config JSON files
-        results.extend(self._walk_model_json_files())
         return results
 
-    def _walk_model_json_files(self) -> List:
-        """Walk the Msty root for model-related JSON config files.
+    def _load_json_file(self, entry):
+        """Read, hash and parse one JSON file.  Runs on a worker thread.
 
-        Returns List[AIArtifact].
+        Returns (file metadata, sha256, parsed JSON), or None when the file
+        is unreadable or not valid JSON.
         """
-        results = []  # type: List[Any]
-        if not os.path.isdir(self._root):
-            return results
-
-        model_keywords = {"model", "llm", "config", "settings"}
-
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
-                continue
-            for fname in filenames:
-                if not fname.endswith(".json"):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                # Only collect files that look model-related by name
-                fname_lower = fname.lower()
-                if not any(kw in fname_lower for kw in model_keywords):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                sanitized = sanitize_content(json.dumps(data))
-                rel_path = os.path.relpath(fpath, self._root)
-
-                results.append(self._make_artifact(
-                    artifact_type="model_config",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "relative_path": rel_path,
-                    },
-                ))
-
-        return results
+        fmeta = self._file_metadata_from_entry(entry)
+        read = self._read_and_hash(entry.path)
+        if read is None:
+            return None
+        data = self._safe_loads_json(read[0])
+        if data is None:
+            return None
+        return fmeta, read[1], data
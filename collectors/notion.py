@@ -3,7 +3,7 @@
 import json
 import os
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from collectors.base import AbstractCollector
 from collectors.mixins import ElectronAppMixin
@@ -11,6 +11,11 @@ from config import HOME
 from normalizer import sanitize_content
 from schema import AIArtifact
 
+# Table names safe to interpolate into a quoted row-count query
+_IDENT_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*\Z")
+
+_WITHOUT_ROWID_RE = re.compile(r"\bWITHOUT\s+ROWID\b", re.IGNORECASE)
+
 
 class NotionCollector(ElectronAppMixin, AbstractCollector):
     """Collect artifacts from the Notion desktop application.
@@ -53,55 +58,87 @@ class NotionCollector(ElectronAppMixin, AbstractCollector):
         Artifact type: sqlite_data."""
         results = []  # type: List[AIArtifact]
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
-                continue
-            for fname in filenames:
-                if not fname.endswith(".db"):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                # List tables in this database
-                tables = self._safe_sqlite_read(
-                    fpath,
-                    "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name",
-                )
-                table_names = [t.get("name", "") for t in tables]
-
-                # Get row counts for each table
-                table_info = {}  # type: Dict[str, int]
-                for tname in table_names:
-                    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', tname):
-                        continue
-                    rows = self._safe_sqlite_read(
-                        fpath,
-                        "SELECT COUNT(*) as cnt FROM \"{}\"".format(tname),
-                    )
-                    if rows:
-                        table_info[tname] = rows[0].get("cnt", 0)
-
-                results.append(self._make_artifact(
-                    artifact_type="sqlite_data",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview="Notion cache DB {}: {} tables, {} total rows".format(
-                        fname, len(table_names), sum(table_info.values()),
-                    ),
-                    metadata={
-                        "database_name": fname,
-                        "tables": table_names,
-                        "table_row_counts": table_info,
-                    },
-                ))
+        entries = [
+            entry for entry in self._iter_files(self._root)
+            if entry.name.endswith(".db")
+            and not self._is_credential_file(entry.path)
+        ]
+        loaded = self._parallel_map(self._read_sqlite_cache, entries)
+
+        for entry, item in zip(entries, loaded):
+            fmeta, file_hash, table_names, table_info, count_methods = item
+            fname = entry.name
+            fpath = entry.path
+            total_rows = sum(table_info.values())
+            if "max_rowid" in count_methods.values():
+                # MAX(rowid) overcounts tables that have had rows deleted
+                rows_text = "~{} rows (max rowid)".format(total_rows)
+            else:
+                rows_text = "{} total rows".format(total_rows)
+
+            results.append(self._make_artifact(
+                artifact_type="sqlite_data",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview="Notion cache DB {}: {} tables, {}".format(
+                    fname, len(table_names), rows_text,
+                ),
+                metadata={
+                    "database_name": fname,
+                    "tables": table_names,
+                    "table_row_counts": table_info,
+                    "row_count_methods": count_methods,
+                },
+            ))
 
         return results
+
+    def _read_sqlite_cache(self, entry):
+        """Hash one cache DB and count rows per table.  Runs on a worker thread.
+
+        Row counts are MAX(rowid), read from the right edge of each table's
+        b-tree instead of scanning it with COUNT(*).  That is exact for
+        append-only tables and an upper bound once rows were deleted.
+        WITHOUT ROWID tables have no rowid and are counted with COUNT(*).
+
+        Returns (file metadata, sha256, table names, row counts by table,
+        count method by table: "max_rowid" or "count").
+        """
+        fpath = entry.path
+        fmeta = self._file_metadata_from_entry(entry)
+        file_hash = self._hash_file(fpath)
+
+        # List tables in this database
+        tables = self._safe_sqlite_read(
+            fpath,
+            "SELECT name, sql FROM sqlite_master WHERE type='table' ORDER BY name",
+        )
+        table_names = [t.get("name", "") for t in tables]
+
+        # Get row counts for each table, all over one connection
+        counted = []  # type: List[Tuple[str, str]]
+        queries = []  # type: List[str]
+        for table in tables:
+            tname = table.get("name", "")
+            if not _IDENT_RE.match(tname):
+                continue
+            if _WITHOUT_ROWID_RE.search(table.get("sql") or ""):
+                method = "count"
+                query = "SELECT COUNT(*) as cnt FROM \"{}\""
+            else:
+                method = "max_rowid"
+                query = "SELECT COALESCE(MAX(_rowid_), 0) as cnt FROM \"{}\""
+            counted.append((tname, method))
+            queries.append(query.format(tname))
+        counts = self._safe_sqlite_read_many(fpath, queries)
+        table_info = {}  # type: Dict[str, int]
+        count_methods = {}  # type: Dict[str, str]
+        for (tname, method), rows in zip(counted, counts):
+            if rows:
+                table_info[tname] = rows[0].get("cnt", 0)
+                count_methods[tname] = method
+
+        return fmeta, file_hash, table_names, table_info, count_methods
@@ -1,13 +1,12 @@
 """Ollama local LLM runner artifact collector (~/.ollama/)."""
 
-import json
 import os
 from typing import Any, Dict, List, Optional
 
 from collectors.base import AbstractCollector
 from collectors.mixins import LocalLLMRunnerMixin
 from config import HOME
-from normalizer import sanitize_content
+from normalizer import sanitize_content, sanitize_json
 from schema import AIArtifact
 
 
@@ -66,29 +65,34 @@ class OllamaCollector(LocalLLMRunnerMixin, AbstractCollector):
         config_extensions = (".json", ".yaml", ".yml", ".conf", ".cfg")
 
         try:
-            entries = os.listdir(self._root)
+            with os.scandir(self._root) as it:
+                entries = list(it)
         except OSError:
             return results
 
-        for fname in entries:
-            fpath = os.path.join(self._root, fname)
-            if os.path.islink(fpath):
-                continue
-            if not os.path.isfile(fpath):
+        for entry in entries:
+            # Cheapest checks first: name, then the readdir file type
+            fname = entry.name
+            if not fname.endswith(config_extensions):
                 continue
+            fpath = entry.path
             if self._is_credential_file(fpath):
                 continue
-
-            # Only collect known config file types
-            if not fname.endswith(config_extensions):
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
                 continue
 
-            fmeta = self._file_metadata(fpath)
-            file_hash = self._hash_file(fpath)
+            fmeta = self._file_metadata_from_entry(entry)
+            # Hash and JSON-parse from one read; only non-JSON configs
+            # are read again as text.
+            read = self._read_and_hash(fpath)
+            file_hash = read[1] if read is not None else None
 
-            data = self._safe_read_json(fpath)
+            data = self._safe_loads_json(read[0]) if read is not None else None
             if data is not None:
-                preview_text = sanitize_content(json.dumps(data))
+                preview_text = sanitize_json(data)
             else:
                 text = self._safe_read_text(fpath)
                 preview_text = sanitize_content(text or "")
@@ -5,15 +5,14 @@ The Atlas app uses UUID-based subdirectories, CK-encrypted .data files,
 binary plist tabs, and an embedded Chromium browser.
 """
 
-import json
 import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from collectors.mixins import ChromiumHistoryMixin, OpenAIDataMixin
-from config import ARTIFACT_PATHS, HOME
-from normalizer import sanitize_content
+from config import ARTIFACT_PATHS, HOME, MAX_FILE_READ_BYTES
+from normalizer import plist_json_default
 
 
 # UUID directory pattern
@@ -22,6 +21,41 @@ _UUID_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Tab plists parsed for title/URL/date
+_PLIST_TAB_NAMES = frozenset({"tabs.plist", "archived-tabs.plist"})
+
+# JSON files holding profile and account info
+_PROFILE_FILENAMES = frozenset({
+    "profile.json", "user.json", "account.json",
+    "preferences.json", "settings.json",
+})
+
+
+def _is_uuid_name(name: str) -> bool:
+    """Return True if name is a canonical UUID (any case)."""
+    # Cheap length/hyphen check first; most directory names fail here.
+    if len(name) != 36:
+        return False
+    if name[8] != "-" or name[13] != "-" or name[18] != "-" or name[23] != "-":
+        return False
+    return _UUID_RE.match(name) is not None
+
+
+def _list_subdirs(path: str) -> List[Tuple[str, str]]:
+    """Return (name, path) for each non-symlink directory directly under path."""
+    subdirs = []  # type: List[Tuple[str, str]]
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.name, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs
+
 
 class OpenAIAtlasCollector(OpenAIDataMixin, ChromiumHistoryMixin, AbstractCollector):
     """Collect artifacts from the OpenAI Atlas macOS desktop application.
@@ -37,6 +71,8 @@ class OpenAIAtlasCollector(OpenAIDataMixin, ChromiumHistoryMixin, AbstractCollec
             "openai_atlas",
             os.path.join(HOME, "Library", "Application Support", "com.openai.atlas"),
         )
+        self._files = None  # type: Optional[List[os.DirEntry]]
+        self._uuid_dirs = None  # type: Optional[List[str]]
 
     @property
     def name(self) -> str:
@@ -46,6 +82,8 @@ class OpenAIAtlasCollector(OpenAIDataMixin, ChromiumHistoryMixin, AbstractCollec
         return os.path.isdir(self._root)
 
     def collect(self) -> List:
+        self._files = None
+        self._uuid_dirs = None
         artifacts = []  # type: List[Any]
         artifacts.extend(self._collect_encrypted_data())
         artifacts.extend(self._collect_plist_tabs())
@@ -57,48 +95,53 @@ class OpenAIAtlasCollector(OpenAIDataMixin, ChromiumHistoryMixin, AbstractCollec
     # ------------------------------------------------------------------
     # helpers
     # ------------------------------------------------------------------
+    def _walk_files(self) -> List[os.DirEntry]:
+        """Regular files under the atlas root, walked once per collect().
+
+        Shared by the plist tab, profile and Statsig passes.
+        """
+        if self._files is None:
+            self._files = list(self._iter_files(self._root))
+        return self._files
+
     def _discover_uuid_dirs(self) -> List[str]:
-        """Walk the atlas root to find UUID-named subdirectories."""
-        uuid_dirs = []  # type: List[str]
-        try:
-            for entry in os.listdir(self._root):
-                entry_path = os.path.join(self._root, entry)
-                if os.path.islink(entry_path):
-                    continue
-                if os.path.isdir(entry_path) and _UUID_RE.match(entry):
-                    uuid_dirs.append(entry_path)
-        except OSError:
-            pass
+        """Find UUID-named subdirectories of the atlas root and one level below.
+
+        Computed once per collect(); symlinked directories are skipped.
+        """
+        if self._uuid_dirs is not None:
+            return self._uuid_dirs
+        subdirs = _list_subdirs(self._root)
+        uuid_dirs = [path for name, path in subdirs if _is_uuid_name(name)]
         # Also check one level deeper
-        try:
-            for entry in os.listdir(self._root):
-                subdir = os.path.join(self._root, entry)
-                if os.path.islink(subdir) or not os.path.isdir(subdir):
-                    continue
-                try:
-                    for child in os.listdir(subdir):
-                        child_path = os.path.join(subdir, child)
-                        if os.path.islink(child_path):
-                            continue
-                        if os.path.isdir(child_path) and _UUID_RE.match(child):
-                            if child_path not in uuid_dirs:
-                                uuid_dirs.append(child_path)
-                except OSError:
-                    continue
-        except OSError:
-            pass
+        for _name, subdir in subdirs:
+            uuid_dirs.extend(
+                path for name, path in _list_subdirs(subdir) if _is_uuid_name(name)
+            )
+        self._uuid_dirs = uuid_dirs
         return uuid_dirs
 
     # ------------------------------------------------------------------
     # 1. Encrypted .data files (metadata only via mixin)
     # ------------------------------------------------------------------
     def _collect_encrypted_data(self) -> List:
-        """Collect metadata for CK-encrypted .data files across all UUID dirs."""
+        """Collect metadata for CK-encrypted .data files across all UUID dirs.
+
+        UUID dirs all lie under the root, so their files are taken from the
+        shared root walk instead of being walked again.
+        """
         results = []  # type: List[Any]
+        data_entries = [entry for entry in self._walk_files() if entry.name.endswith(".data")]
         # Collect from the root and each UUID subdirectory
-        results.extend(self._collect_encrypted_data_files(self._root, tool_name="OpenAI Atlas"))
+        results.extend(self._collect_encrypted_data_files(
+            self._root, tool_name="OpenAI Atlas", entries=data_entries,
+        ))
         for uuid_dir in self._discover_uuid_dirs():
-            results.extend(self._collect_encrypted_data_files(uuid_dir, tool_name="OpenAI Atlas"))
+            prefix = os.path.join(uuid_dir, "")
+            results.extend(self._collect_encrypted_data_files(
+                uuid_dir, tool_name="OpenAI Atlas",
+                entries=[entry for entry in data_entries if entry.path.startswith(prefix)],
+            ))
         return results
 
     # ------------------------------------------------------------------
@@ -107,70 +150,103 @@ class OpenAIAtlasCollector(OpenAIDataMixin, ChromiumHistoryMixin, AbstractCollec
     def _collect_plist_tabs(self) -> List:
         """Parse binary plist tab files for title, URL, and date information."""
         results = []  # type: List[Any]
-        plist_names = ["tabs.plist", "archived-tabs.plist"]
+        entries = [entry for entry in self._walk_files() if entry.name in _PLIST_TAB_NAMES]
+        loaded = self._parallel_map(self._load_plist_tabs, entries)
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
+        for entry, item in zip(entries, loaded):
+            if item is None:
                 continue
-            for fname in filenames:
-                if fname not in plist_names:
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                plist_data = self._safe_read_plist(fpath)
-                if plist_data is None:
-                    continue
-
-                safe_data = self._plist_to_json_safe(plist_data)
-
-                # Extract tab entries if the plist contains a list of tabs
-                tabs = []  # type: List[Dict[str, Any]]
-                if isinstance(safe_data, list):
-                    for tab in safe_data:
-                        if isinstance(tab, dict):
-                            tabs.append({
-                                "title": tab.get("title", ""),
-                                "url": tab.get("url", tab.get("URL", "")),
-                                "date": tab.get("date", tab.get("lastAccessDate", "")),
-                            })
-                elif isinstance(safe_data, dict):
-                    # Some plists wrap tabs under a key
-                    for key in ("tabs", "archivedTabs", "items"):
-                        tab_list = safe_data.get(key)
-                        if isinstance(tab_list, list):
-                            for tab in tab_list:
-                                if isinstance(tab, dict):
-                                    tabs.append({
-                                        "title": tab.get("title", ""),
-                                        "url": tab.get("url", tab.get("URL", "")),
-                                        "date": tab.get("date", tab.get("lastAccessDate", "")),
-                                    })
-
-                sanitized_text = sanitize_content(json.dumps(safe_data, default=str))
-
+            fmeta, file_hash, tabs, sanitized_text, raw_data = item
+            if tabs is None:
+                # Over MAX_FILE_READ_BYTES: inventoried without being read
                 results.append(self._make_artifact(
                     artifact_type="tab_data",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
+                    file_path=entry.path,
                     file_size_bytes=fmeta.get("file_size_bytes"),
                     file_modified=fmeta.get("file_modified"),
                     file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized_text),
-                    raw_data=sanitized_text if len(sanitized_text) < 50000 else None,
                     metadata={
-                        "plist_file": fname,
-                        "tab_count": len(tabs),
-                        "tabs": tabs[:50],
+                        "plist_file": entry.name,
+                        "skipped_reason": "size_limit",
                     },
                 ))
+                continue
+
+            results.append(self._make_artifact(
+                artifact_type="tab_data",
+                file_path=entry.path,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized_text),
+                raw_data=raw_data,
+                metadata={
+                    "plist_file": entry.name,
+                    "tab_count": len(tabs),
+                    "tabs": tabs[:50],
+                },
+            ))
 
         return results
 
+    def _load_plist_tabs(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[
+        Dict[str, Any], Optional[str], Optional[List[Dict[str, Any]]],
+        Optional[str], Optional[str],
+    ]]:
+        """Hash, parse and sanitize one tab plist.
+
+        Returns (file metadata, hash, tabs, sanitized JSON, raw_data) or
+        None if the plist is unreadable.  A plist over MAX_FILE_READ_BYTES
+        is not opened: only its metadata is returned, with the other
+        fields None.  Runs on a worker thread.
+        """
+        fpath = entry.path
+        fmeta = self._file_metadata_from_entry(entry)
+        if (fmeta.get("file_size_bytes") or 0) > MAX_FILE_READ_BYTES:
+            return fmeta, None, None, None, None
+        loaded = self._read_and_hash(fpath)
+        if loaded is None:
+            return None
+        raw, file_hash = loaded
+
+        plist_data = self._safe_loads_plist(raw)
+        if plist_data is None:
+            return None
+
+        # Extract tab entries if the plist contains a list of tabs
+        tabs = []  # type: List[Dict[str, Any]]
+        if isinstance(plist_data, list):
+            for tab in plist_data:
+                if isinstance(tab, dict):
+                    tabs.append({
+                        "title": tab.get("title", ""),
+                        "url": tab.get("url", tab.get("URL", "")),
+                        "date": tab.get("date", tab.get("lastAccessDate", "")),
+                    })
+        elif isinstance(plist_data, dict):
+            # Some plists wrap tabs under a key
+            for key in ("tabs", "archivedTabs", "items"):
+                tab_list = plist_data.get(key)
+                if isinstance(tab_list, list):
+                    for tab in tab_list:
+                        if isinstance(tab, dict):
+                            tabs.append({
+                                "title": tab.get("title", ""),
+                                "url": tab.get("url", tab.get("URL", "")),
+                                "date": tab.get("date", tab.get("lastAccessDate", "")),
+                            })
+
+        # Only the extracted fields need JSON-safe values; the whole
+        # plist is encoded directly through plist_json_default
+        tabs = self._plist_to_json_safe(tabs)
+        sanitized_text, raw_data = self._preview_sanitize(
+            plist_data, default=plist_json_default,
+        )
+        return fmeta, file_hash, tabs, sanitized_text, raw_data
+
     # ------------------------------------------------------------------
     # 3. Embedded Chromium browser history
     # ------------------------------------------------------------------
@@ -192,101 +268,114 @@ class OpenAIAtlasCollector(OpenAIDataMixin, ChromiumHistoryMixin, AbstractCollec
     # ------------------------------------------------------------------
     def _collect_profile_data(self) -> List:
         """Collect profile and account JSON files."""
-        results = []  # type: List[Any]
-        profile_filenames = {
-            "profile.json", "user.json", "account.json",
-            "preferences.json", "settings.json",
-        }
-
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
-                continue
-            for fname in filenames:
-                if fname not in profile_filenames:
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-                sanitized = sanitize_content(json.dumps(data))
-
-                results.append(self._make_artifact(
-                    artifact_type="profile",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "relative_path": os.path.relpath(fpath, self._root),
-                    },
-                ))
-
-        return results
+        entries = [
+            entry for entry in self._walk_files()
+            if entry.name in _PROFILE_FILENAMES
+            and not self._is_credential_file(entry.path)
+        ]
+        return self._collect_json_artifacts(entries, "profile")
 
     # ------------------------------------------------------------------
     # 5. Statsig analytics
     # ------------------------------------------------------------------
     def _collect_statsig_analytics(self) -> List:
         """Collect Statsig analytics/experiment data files."""
-        results = []  # type: List[Any]
-
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
+        entries = []  # type: List[os.DirEntry]
+        # A directory's files are contiguous in the walk, so its name is
+        # checked once rather than per file
+        dir_path = None  # type: Optional[str]
+        dir_is_statsig = False
+        for entry in self._walk_files():
+            fname = entry.name
+            if not (fname.endswith(".json") or fname.endswith(".plist")):
                 continue
             # Look for statsig-related directories and files
-            dir_basename = os.path.basename(dirpath).lower()
-            for fname in filenames:
-                if "statsig" not in fname.lower() and "statsig" not in dir_basename:
-                    continue
-                if not (fname.endswith(".json") or fname.endswith(".plist")):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
+            if "statsig" not in fname.lower():
+                parent = os.path.dirname(entry.path)
+                if parent != dir_path:
+                    dir_path = parent
+                    dir_is_statsig = "statsig" in os.path.basename(parent).lower()
+                if not dir_is_statsig:
                     continue
+            entries.append(entry)
+        return self._collect_json_artifacts(
+            entries, "analytics", {"analytics_provider": "statsig"},
+        )
 
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                if fname.endswith(".plist"):
-                    plist_data = self._safe_read_plist(fpath)
-                    if plist_data is None:
-                        continue
-                    safe_data = self._plist_to_json_safe(plist_data)
-                    text = json.dumps(safe_data, default=str)
-                else:
-                    data = self._safe_read_json(fpath)
-                    if data is None:
-                        continue
-                    text = json.dumps(data)
-
-                sanitized = sanitize_content(text)
+    def _collect_json_artifacts(
+        self,
+        entries: List[os.DirEntry],
+        artifact_type: str,
+        extra_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List:
+        """Load .json/.plist entries on the thread pool and build artifacts.
+
+        Shared by the profile and Statsig passes; entries are emitted in
+        order, with extra_metadata appended to each artifact's metadata.
+        """
+        results = []  # type: List[Any]
+        loaded = self._parallel_map(self._load_json_artifact, entries)
 
-                results.append(self._make_artifact(
-                    artifact_type="analytics",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "relative_path": os.path.relpath(fpath, self._root),
-                        "analytics_provider": "statsig",
-                    },
-                ))
+        for entry, item in zip(entries, loaded):
+            if item is None:
+                continue
+            fmeta, file_hash, sanitized, raw_data = item
+            fpath = entry.path
+            metadata = {
+                "filename": entry.name,
+                "relative_path": self._relative_path(fpath, self._root),
+            }  # type: Dict[str, Any]
+            if extra_metadata:
+                metadata.update(extra_metadata)
+            if sanitized is None:
+                # Over MAX_FILE_READ_BYTES: inventoried without being read
+                metadata["skipped_reason"] = "size_limit"
+
+            results.append(self._make_artifact(
+                artifact_type=artifact_type,
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=(
+                    self._content_preview(sanitized) if sanitized is not None else None
+                ),
+                raw_data=raw_data,
+                metadata=metadata,
+            ))
 
         return results
+
+    def _load_json_artifact(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[Dict[str, Any], Optional[str], Optional[str], Optional[str]]]:
+        """Hash, parse and sanitize one .json or .plist file.
+
+        Returns (file metadata, hash, sanitized JSON, raw_data) or None if
+        the file cannot be parsed.  A file over MAX_FILE_READ_BYTES is not
+        opened: only its metadata is returned, with the other fields None.
+        Runs on a worker thread.
+        """
+        fpath = entry.path
+        default = str  # type: Callable[[Any], Any]
+        # Over-size files would be refused by _read_and_hash; catch them on
+        # the walk's cached stat before opening anything
+        fmeta = self._file_metadata_from_entry(entry)
+        if (fmeta.get("file_size_bytes") or 0) > MAX_FILE_READ_BYTES:
+            return fmeta, None, None, None
+        loaded = self._read_and_hash(fpath)
+        if loaded is None:
+            return None
+        raw, file_hash = loaded
+        if entry.name.endswith(".plist"):
+            data = self._safe_loads_plist(raw)
+            default = plist_json_default
+        else:
+            data = self._safe_loads_json(raw)
+        if data is None:
+            return None
+        sanitized, raw_data = self._preview_sanitize(
+            data, default=default,
+        )
+        return fmeta, file_hash, sanitized, raw_data
@@ -8,14 +8,13 @@ Perplexity is an Electron app; we use ElectronAppMixin to extract
 LevelDB/IndexedDB data, session storage, and preferences.
 """
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+import stat
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from collectors.base import AbstractCollector
 from collectors.mixins import ElectronAppMixin
 from config import ARTIFACT_PATHS, HOME
-from normalizer import sanitize_content
 
 
 class PerplexityCollector(ElectronAppMixin, AbstractCollector):
@@ -37,6 +36,8 @@ class PerplexityCollector(ElectronAppMixin, AbstractCollector):
         self._container_root = os.path.join(
             HOME, "Library", "Containers", "ai.perplexity.mac",
         )
+        # (st_dev, st_ino) of config files already collected this run
+        self._seen_files = set()  # type: Set[Tuple[int, int]]
 
     @property
     def name(self) -> str:
@@ -46,6 +47,7 @@ class PerplexityCollector(ElectronAppMixin, AbstractCollector):
         return os.path.isdir(self._root) or os.path.isdir(self._container_root)
 
     def collect(self) -> List:
+        self._seen_files = set()
         artifacts = []  # type: List[Any]
         for app_root in self._get_app_roots():
             artifacts.extend(self._collect_from_app_root(app_root))
@@ -55,12 +57,12 @@ class PerplexityCollector(ElectronAppMixin, AbstractCollector):
     # helpers
     # ------------------------------------------------------------------
     def _get_app_roots(self) -> List[str]:
-        """Return all valid Perplexity app data directories."""
-        roots = []  # type: List[str]
-
-        if os.path.isdir(self._root):
-            roots.append(self._root)
+        """Return all valid Perplexity app data directories.
 
+        A root that is the same directory as an earlier one (e.g. the app
+        support dir symlinked into the container) is returned only once.
+        """
+        candidates = [self._root]
         if os.path.isdir(self._container_root):
             # The container may have the actual data in a Data subdirectory
             data_subdir = os.path.join(
@@ -68,10 +70,22 @@ class PerplexityCollector(ElectronAppMixin, AbstractCollector):
                 "Application Support", "Perplexity",
             )
             if os.path.isdir(data_subdir):
-                roots.append(data_subdir)
-            elif self._container_root not in roots:
-                roots.append(self._container_root)
+                candidates.append(data_subdir)
+            else:
+                candidates.append(self._container_root)
 
+        roots = []  # type: List[str]
+        seen = set()  # type: Set[Tuple[int, int]]
+        for path in candidates:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if not stat.S_ISDIR(st.st_mode) or key in seen:
+                continue
+            seen.add(key)
+            roots.append(path)
         return roots
 
     def _collect_from_app_root(self, app_root: str) -> List:
@@ -93,29 +107,43 @@ class PerplexityCollector(ElectronAppMixin, AbstractCollector):
         results = []  # type: List[Any]
 
         try:
-            entries = os.listdir(app_root)
+            with os.scandir(app_root) as it:
+                entries = list(it)
         except OSError:
             return results
 
-        for fname in entries:
+        for entry in entries:
+            fname = entry.name
             if not fname.endswith(".json"):
                 continue
             # Skip Preferences (handled by ElectronAppMixin)
             if fname == "Preferences":
                 continue
-            fpath = os.path.join(app_root, fname)
-            if os.path.islink(fpath) or not os.path.isfile(fpath):
-                continue
+            fpath = entry.path
             if self._is_credential_file(fpath):
                 continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            # Same file reached from the other app root (hard link)
+            key = (st.st_dev, st.st_ino)
+            if key in self._seen_files:
+                continue
+            self._seen_files.add(key)
 
-            data = self._safe_read_json(fpath)
+            loaded = self._read_and_hash(fpath)
+            if loaded is None:
+                continue
+            raw, file_hash = loaded
+            data = self._safe_loads_json(raw)
             if data is None:
                 continue
 
-            fmeta = self._file_metadata(fpath)
-            file_hash = self._hash_file(fpath)
-            sanitized = sanitize_content(json.dumps(data))
+            fmeta = self._file_metadata(fpath, st)
+            sanitized, raw_data = self._preview_sanitize(data)
 
             results.append(self._make_artifact(
                 artifact_type="config",
@@ -125,7 +153,7 @@ class PerplexityCollector(ElectronAppMixin, AbstractCollector):
                 file_modified=fmeta.get("file_modified"),
                 file_created=fmeta.get("file_created"),
                 content_preview=self._content_preview(sanitized),
-                raw_data=sanitized if len(sanitized) < 50000 else None,
+                raw_data=raw_data,
                 metadata={
                     "filename": fname,
                     "app_root": app_root,
@@ -1,14 +1,24 @@
 """Pieces artifact collector."""
 
-import json
 import os
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from config import HOME
-from normalizer import sanitize_content
 from schema import AIArtifact
 
+# Filename keywords selecting each pass's files (case-insensitive)
+_SNIPPET_FILE_RE = re.compile(r"snippet|asset|piece|format", re.IGNORECASE)
+_CONTEXT_FILE_RE = re.compile(r"context|conversation|anchor|annotation", re.IGNORECASE)
+_LOG_FILE_RE = re.compile(r"log|production", re.IGNORECASE)
+
+# Snippet files above this size are stream-parsed: only the element count
+# and enough leading elements to fill the preview are kept.
+_STREAM_JSON_BYTES = 1000000
+# Past where _preview_sanitize() cuts its JSON
+_SNIPPET_HEAD_CHARS = 50000 + 1024
+
 
 class PiecesCollector(AbstractCollector):
     """Collect artifacts from Pieces for Developers.
@@ -20,6 +30,7 @@ class PiecesCollector(AbstractCollector):
     def __init__(self) -> None:
         super().__init__()
         self._root = os.path.join(HOME, "Library", "com.pieces.os")
+        self._files = None  # type: Optional[List[os.DirEntry]]
 
     @property
     def name(self) -> str:
@@ -32,12 +43,102 @@ class PiecesCollector(AbstractCollector):
         if not os.path.isdir(self._root):
             return []
 
+        self._files = None
         artifacts = []  # type: List[AIArtifact]
         artifacts.extend(self._collect_snippet_inventory())
         artifacts.extend(self._collect_context_metadata())
         artifacts.extend(self._collect_production_logs())
         return artifacts
 
+    # ------------------------------------------------------------------
+    # helpers
+    # ------------------------------------------------------------------
+    def _walk_files(self) -> List[os.DirEntry]:
+        """Regular files under the Pieces root, walked once per collect().
+
+        Shared by the snippet, context and log passes.
+        """
+        if self._files is None:
+            self._files = list(self._iter_files(self._root))
+        return self._files
+
+    def _load_json_entry(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[Dict[str, Any], str, Any, str, Optional[str]]]:
+        """Hash, parse and sanitize one JSON file.
+
+        Returns (file metadata, hash, parsed data, sanitized JSON, raw data)
+        or None if the file is unreadable or not JSON.  Runs on a worker
+        thread.
+        """
+        read = self._read_and_hash(entry.path)
+        if read is None:
+            return None
+        raw, file_hash = read
+        data = self._safe_loads_json(raw)
+        if data is None:
+            return None
+        fmeta = self._file_metadata_from_entry(entry)
+        sanitized, raw_data = self._preview_sanitize(data)
+        return fmeta, file_hash, data, sanitized, raw_data
+
+    def _load_snippet_entry(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[Dict[str, Any], str, int, str, Optional[str]]]:
+        """Hash, count and sanitize one snippet file.
+
+        Returns (file metadata, hash, entry count, sanitized JSON, raw data)
+        or None if the file is unreadable or not JSON.  Large top-level
+        arrays are counted by streaming instead of parsing them whole.
+        Runs on a worker thread.
+        """
+        fmeta = self._file_metadata_from_entry(entry)
+        size = fmeta.get("file_size_bytes") or 0
+        if size <= _STREAM_JSON_BYTES:
+            loaded = self._load_json_entry(entry)
+            if loaded is None:
+                return None
+            fmeta, file_hash, data, sanitized, raw_data = loaded
+            if isinstance(data, list):
+                entry_count = len(data)
+            elif isinstance(data, dict):
+                entry_count = 1
+            else:
+                entry_count = 0
+            return fmeta, file_hash, entry_count, sanitized, raw_data
+
+        file_hash = self._hash_file(entry.path)
+        if file_hash is None:
+            return None
+        prefix = self._safe_iter_json_prefix(
+            entry.path, max_items=0, head_chars=_SNIPPET_HEAD_CHARS,
+        )
+        if prefix is None:
+            return None
+        head, entry_count = prefix
+        if isinstance(head, dict):
+            entry_count = 1
+        # A streamed file is past the raw_data limit; the head is preview only
+        sanitized, _ = self._preview_sanitize(head)
+        return fmeta, file_hash, entry_count, sanitized, None
+
+    def _load_log_entry(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[Dict[str, Any], str, str, Optional[str], int]]:
+        """Hash and sanitize one log file.
+
+        Returns (file metadata, hash, sanitized text, raw data, line count)
+        or None if the file is unreadable.  Runs on a worker thread.
+        """
+        read = self._read_and_hash(entry.path)
+        if read is None:
+            return None
+        raw, file_hash = read
+        text = self._decode_text(raw)
+        fmeta = self._file_metadata_from_entry(entry)
+        sanitized, raw_data = self._preview_sanitize_text(text)
+        return fmeta, file_hash, sanitized, raw_data, text.count("\n")
+
     # ------------------------------------------------------------------
     # 1. Snippet inventory (metadata only)
     # ------------------------------------------------------------------
@@ -49,62 +150,47 @@ class PiecesCollector(AbstractCollector):
         # Look for snippet data in JSON files
         snippet_entries = []  # type: List[Dict[str, Any]]
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
+        entries = []  # type: List[os.DirEntry]
+        for entry in self._walk_files():
+            fname = entry.name
+            if not fname.endswith(".json"):
                 continue
-            for fname in filenames:
-                if not fname.endswith(".json"):
-                    continue
-                # Look for snippet-related files
-                fname_lower = fname.lower()
-                if not any(
-                    kw in fname_lower
-                    for kw in ("snippet", "asset", "piece", "format")
-                ):
-                    continue
-
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                sanitized = sanitize_content(json.dumps(data, default=str))
-
-                entry_count = 0
-                if isinstance(data, list):
-                    entry_count = len(data)
-                elif isinstance(data, dict):
-                    entry_count = 1
+            # Look for snippet-related files
+            if not _SNIPPET_FILE_RE.search(fname):
+                continue
+            if self._is_credential_file(entry.path):
+                continue
+            entries.append(entry)
+        loaded = self._parallel_map(self._load_snippet_entry, entries)
 
-                snippet_entries.append({
+        for entry, item in zip(entries, loaded):
+            if item is None:
+                continue
+            fmeta, file_hash, entry_count, sanitized, raw_data = item
+            fname = entry.name
+            fpath = entry.path
+
+            snippet_entries.append({
+                "filename": fname,
+                "relative_path": self._relative_path(fpath, self._root),
+                "entry_count": entry_count,
+                "size_bytes": fmeta.get("file_size_bytes") or 0,
+            })
+
+            results.append(self._make_artifact(
+                artifact_type="snippet_inventory",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
                     "filename": fname,
-                    "relative_path": os.path.relpath(fpath, self._root),
                     "entry_count": entry_count,
-                    "size_bytes": fmeta.get("file_size_bytes") or 0,
-                })
-
-                results.append(self._make_artifact(
-                    artifact_type="snippet_inventory",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "entry_count": entry_count,
-                    },
-                ))
+                },
+            ))
 
         if snippet_entries and len(snippet_entries) > 1:
             # Add summary artifact
@@ -132,47 +218,38 @@ class PiecesCollector(AbstractCollector):
         Artifact type: context_metadata."""
         results = []  # type: List[AIArtifact]
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
+        entries = []  # type: List[os.DirEntry]
+        for entry in self._walk_files():
+            fname = entry.name
+            if not fname.endswith(".json"):
+                continue
+            if not _CONTEXT_FILE_RE.search(fname):
                 continue
-            for fname in filenames:
-                if not fname.endswith(".json"):
-                    continue
-                fname_lower = fname.lower()
-                if not any(
-                    kw in fname_lower
-                    for kw in ("context", "conversation", "anchor", "annotation")
-                ):
-                    continue
-
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-                sanitized = sanitize_content(json.dumps(data, default=str))
-
-                results.append(self._make_artifact(
-                    artifact_type="context_metadata",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "relative_path": os.path.relpath(fpath, self._root),
-                    },
-                ))
+            if self._is_credential_file(entry.path):
+                continue
+            entries.append(entry)
+        loaded = self._parallel_map(self._load_json_entry, entries)
+
+        for entry, item in zip(entries, loaded):
+            if item is None:
+                continue
+            fmeta, file_hash, _data, sanitized, raw_data = item
+            fpath = entry.path
+
+            results.append(self._make_artifact(
+                artifact_type="context_metadata",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
+                    "filename": entry.name,
+                    "relative_path": self._relative_path(fpath, self._root),
+                },
+            ))
 
         return results
 
@@ -184,44 +261,36 @@ class PiecesCollector(AbstractCollector):
         Artifact type: log."""
         results = []  # type: List[AIArtifact]
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
+        entries = []  # type: List[os.DirEntry]
+        for entry in self._walk_files():
+            fname = entry.name
+            if not (fname.endswith(".log") or fname.endswith(".txt")):
+                continue
+            if not _LOG_FILE_RE.search(fname):
+                continue
+            entries.append(entry)
+        loaded = self._parallel_map(self._load_log_entry, entries)
+
+        for entry, item in zip(entries, loaded):
+            if item is None:
                 continue
-            for fname in filenames:
-                if not (fname.endswith(".log") or fname.endswith(".txt")):
-                    continue
-                fname_lower = fname.lower()
-                if "log" not in fname_lower and "production" not in fname_lower:
-                    continue
-
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                text = self._safe_read_text(fpath)
-                if text is None:
-                    continue
-
-                sanitized = sanitize_content(text)
-                line_count = text.count("\n")
-
-                results.append(self._make_artifact(
-                    artifact_type="log",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "line_count": line_count,
-                        "relative_path": os.path.relpath(fpath, self._root),
-                    },
-                ))
+            fmeta, file_hash, sanitized, raw_data, line_count = item
+            fpath = entry.path
+
+            results.append(self._make_artifact(
+                artifact_type="log",
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
+                    "filename": entry.name,
+                    "line_count": line_count,
+                    "relative_path": self._relative_path(fpath, self._root),
+                },
+            ))
 
         return results
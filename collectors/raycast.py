@@ -1,14 +1,16 @@
 """Raycast artifact collector."""
 
-import json
 import os
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from config import HOME
-from normalizer import sanitize_content
 from schema import AIArtifact
 
+# Filename keywords marking preference files (case-insensitive)
+_PREFERENCE_FILE_RE = re.compile(r"preference|setting", re.IGNORECASE)
+
 
 class RaycastCollector(AbstractCollector):
     """Collect artifacts from Raycast launcher.
@@ -55,11 +57,12 @@ class RaycastCollector(AbstractCollector):
 
         ext_entries = []  # type: List[Dict[str, Any]]
         try:
-            for entry in os.listdir(extensions_dir):
-                ext_path = os.path.join(extensions_dir, entry)
-                if not os.path.isdir(ext_path) or os.path.islink(ext_path):
-                    continue
-
+            with os.scandir(extensions_dir) as it:
+                ext_dirs = [
+                    (d.name, d.path) for d in it
+                    if d.is_dir(follow_symlinks=False)
+                ]
+            for entry, ext_path in ext_dirs:
                 pkg_json = os.path.join(ext_path, "package.json")
                 if os.path.isfile(pkg_json):
                     data = self._safe_read_json(pkg_json)
@@ -108,45 +111,58 @@ class RaycastCollector(AbstractCollector):
         Artifact type: preferences."""
         results = []  # type: List[AIArtifact]
 
-        for dirpath, _dirnames, filenames in os.walk(self._root):
-            if os.path.islink(dirpath):
+        entries = []  # type: List[os.DirEntry]
+        for entry in self._iter_files(self._root):
+            fname = entry.name
+            if not fname.endswith(".json"):
+                continue
+            if not _PREFERENCE_FILE_RE.search(fname):
+                continue
+            if self._is_credential_file(entry.path):
+                continue
+            entries.append(entry)
+        loaded = self._parallel_map(self._load_preference_file, entries)
+
+        for entry, item in zip(entries, loaded):
+            if item is None:
                 continue
-            for fname in filenames:
-                if not fname.endswith(".json"):
-                    continue
-                if "preference" not in fname.lower() and "setting" not in fname.lower():
-                    continue
-
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                data = self._safe_read_json(fpath)
-                if data is None:
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-                sanitized = sanitize_content(json.dumps(data, default=str))
-
-                results.append(self._make_artifact(
-                    artifact_type="preferences",
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                    },
-                ))
+            fmeta, file_hash, sanitized, raw_data = item
+
+            results.append(self._make_artifact(
+                artifact_type="preferences",
+                file_path=entry.path,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
+                    "filename": entry.name,
+                },
+            ))
 
         return results
 
+    def _load_preference_file(
+        self, entry: os.DirEntry
+    ) -> Optional[Tuple[Dict[str, Any], str, str, Optional[str]]]:
+        """Hash, parse and sanitize one preference file.
+
+        Returns (file metadata, hash, sanitized JSON, raw data) or None if
+        the file is unreadable or not JSON.  Runs on a worker thread.
+        """
+        read = self._read_and_hash(entry.path)
+        if read is None:
+            return None
+        raw, file_hash = read
+        data = self._safe_loads_json(raw)
+        if data is None:
+            return None
+        fmeta = self._file_metadata_from_entry(entry)
+        sanitized, raw_data = self._preview_sanitize(data)
+        return fmeta, file_hash, sanitized, raw_data
+
     # ------------------------------------------------------------------
     # 3. Encrypted database flag
     # ------------------------------------------------------------------
@@ -156,14 +172,16 @@ class RaycastCollector(AbstractCollector):
         results = []  # type: List[AIArtifact]
 
         # Look for common DB files
-        for fname in os.listdir(self._root):
-            fpath = os.path.join(self._root, fname)
-            if not os.path.isfile(fpath) or os.path.islink(fpath):
-                continue
-            if not (fname.endswith(".db") or fname.endswith(".sqlite") or fname.endswith(".realm")):
-                continue
-
-            fmeta = self._file_metadata(fpath)
+        with os.scandir(self._root) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith((".db", ".sqlite", ".realm"))
+                and e.is_file(follow_symlinks=False)
+            ]
+        for entry in entries:
+            fname = entry.name
+            fpath = entry.path
+            fmeta = self._file_metadata_from_entry(entry)
             file_hash = self._hash_file(fpath)
 
             results.append(self._make_artifact(
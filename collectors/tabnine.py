@@ -1,12 +1,10 @@
 """TabNine collector for standalone application artifacts."""
 
-import json
 import os
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 from collectors.base import AbstractCollector
 from config import HOME
-from normalizer import sanitize_content
 from schema import AIArtifact
 
 
@@ -35,47 +33,56 @@ class TabnineCollector(AbstractCollector):
         results = []  # type: List[AIArtifact]
         collectible_extensions = (".json", ".log", ".yaml", ".yml")
 
-        for dirpath, _dirnames, filenames in os.walk(TABNINE_PATH):
-            if os.path.islink(dirpath):
-                continue
-            for fname in filenames:
-                if not fname.endswith(collectible_extensions):
-                    continue
-                fpath = os.path.join(dirpath, fname)
-                if os.path.islink(fpath) or not os.path.isfile(fpath):
-                    continue
-                if self._is_credential_file(fpath):
-                    continue
-
-                fmeta = self._file_metadata(fpath)
-                file_hash = self._hash_file(fpath)
-
-                # Try JSON first, fall back to plain text
-                data = self._safe_read_json(fpath)
-                if data is not None:
-                    preview_text = json.dumps(data)
-                else:
-                    text = self._safe_read_text(fpath)
-                    preview_text = text or ""
-
-                sanitized = sanitize_content(preview_text)
-                rel_path = os.path.relpath(fpath, TABNINE_PATH)
-
-                artifact_type = "log_file" if fname.endswith(".log") else "extension_data"
-
-                results.append(self._make_artifact(
-                    artifact_type=artifact_type,
-                    file_path=fpath,
-                    file_hash_sha256=file_hash,
-                    file_size_bytes=fmeta.get("file_size_bytes"),
-                    file_modified=fmeta.get("file_modified"),
-                    file_created=fmeta.get("file_created"),
-                    content_preview=self._content_preview(sanitized),
-                    raw_data=sanitized if len(sanitized) < 50000 else None,
-                    metadata={
-                        "filename": fname,
-                        "relative_path": rel_path,
-                    },
-                ))
+        entries = [
+            entry for entry in self._iter_files(TABNINE_PATH)
+            if entry.name.endswith(collectible_extensions)
+            and not self._is_credential_file(entry.path)
+        ]
+        loaded = self._parallel_map(self._load_file, entries)
+
+        for entry, (fmeta, file_hash, sanitized, raw_data) in zip(entries, loaded):
+            fname = entry.name
+            fpath = entry.path
+            rel_path = self._relative_path(fpath, TABNINE_PATH)
+
+            artifact_type = "log_file" if fname.endswith(".log") else "extension_data"
+
+            results.append(self._make_artifact(
+                artifact_type=artifact_type,
+                file_path=fpath,
+                file_hash_sha256=file_hash,
+                file_size_bytes=fmeta.get("file_size_bytes"),
+                file_modified=fmeta.get("file_modified"),
+                file_created=fmeta.get("file_created"),
+                content_preview=self._content_preview(sanitized),
+                raw_data=raw_data,
+                metadata={
+                    "filename": fname,
+                    "relative_path": rel_path,
+                },
+            ))
 
         return results
+
+    def _load_file(
+        self, entry: os.DirEntry
+    ) -> Tuple[Dict[str, Any], Optional[str], str, Optional[str]]:
+        """Hash and sanitize one file, as JSON if it parses, else as text.
+
+        Returns (file metadata, hash, sanitized content, raw data); an
+        unreadable file yields no hash and empty content.  Runs on a
+        worker thread.
+        """
+        fmeta = self._file_metadata_from_entry(entry)
+        # Hash and parse from one read
+        read = self._read_and_hash(entry.path)
+        file_hash = read[1] if read is not None else None
+
+        # Try JSON first, fall back to plain text
+        data = self._safe_loads_json(read[0]) if read is not None else None
+        if data is not None:
+            sanitized, raw_data = self._preview_sanitize(data)
+        else:
+            text = self._decode_text(read[0]) if read is not None else ""
+            sanitized, raw_data = self._preview_sanitize_text(text)
+        return fmeta, file_hash, sanitized, raw_data
@@ -10,11 +10,19 @@ APP_NAME = "AIFT - AI Forensics Tool"
 # Database
 DB_DIR = os.path.expanduser("~/.ai-forensics")
 DB_PATH = os.path.join(DB_DIR, "aift.db")
+HASH_CACHE_PATH = os.path.join(DB_DIR, "hash_cache.json")
+# Reuse file digests saved at HASH_CACHE_PATH by earlier runs.  Off by
+# default so every evidence hash is computed during the run itself;
+# "aift collect --hash-cache" enables it for one run.
+PERSIST_HASH_CACHE = False
 
 # Content limits
 CONTENT_PREVIEW_MAX = 500
 MAX_FILE_READ_BYTES = 50 * 1024 * 1024  # 50 MB safety limit
 
+# Worker threads for overlapping per-file reads and hashing
+IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 # Security: credential patterns to redact
 CREDENTIAL_PATTERNS = [
     re.compile(r'sk-[a-zA-Z0-9_-]{20,}'),          # Anthropic/OpenAI API keys
@@ -37,8 +45,11 @@ CREDENTIAL_PATTERNS = [
     re.compile(r'pypi-[a-zA-Z0-9\-_]{16,}'),           # PyPI tokens
     re.compile(r'eyJ[a-zA-Z0-9_-]+\.eyJ[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+'),  # JWT tokens
     re.compile(r'-----BEGIN (?:RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----'),  # SSH private keys
-    re.compile(r'(?=[a-fA-F0-9]*[a-fA-F])(?=[a-fA-F0-9]*[0-9])[a-fA-F0-9]{40,}'),  # Long hex tokens (mixed digits+letters, 40+ chars)
-    re.compile(r'(?=[A-Za-z0-9+/]*[A-Z])(?=[A-Za-z0-9+/]*[a-z])(?=[A-Za-z0-9+/]*[0-9])[A-Za-z0-9+/]{40,}={0,2}'),  # Long base64 tokens (mixed case+digits, 40+ chars)
+    # The two run patterns below only start at the beginning of a run of
+    # 40+ class characters: a run that fails there fails at every later
+    # offset too, so this skips rescanning it from each position.
+    re.compile(r'(?<![a-fA-F0-9])(?=[a-fA-F0-9]{40})(?=[a-fA-F0-9]*[a-fA-F])(?=[a-fA-F0-9]*[0-9])[a-fA-F0-9]{40,}'),  # Long hex tokens (mixed digits+letters, 40+ chars)
+    re.compile(r'(?<![A-Za-z0-9+/])(?=[A-Za-z0-9+/]{40})(?=[A-Za-z0-9+/]*[A-Z])(?=[A-Za-z0-9+/]*[a-z])(?=[A-Za-z0-9+/]*[0-9])[A-Za-z0-9+/]{40,}={0,2}'),  # Long base64 tokens (mixed case+digits, 40+ chars)
 ]
 
 # Files that should never have content extracted
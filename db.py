@@ -3,6 +3,7 @@
 import json
 import os
 import sqlite3
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from config import DB_DIR, DB_PATH
@@ -17,6 +18,9 @@ ARTIFACT_COLUMNS = [
     "collection_timestamp",
 ]
 
+# Row tuple for an AIArtifact, read straight from its attributes
+_artifact_row = attrgetter(*ARTIFACT_COLUMNS)
+
 RUN_COLUMNS = [
     "id", "start_time", "end_time", "collectors_run", "total_artifacts",
     "errors", "hostname", "username",
@@ -110,10 +114,7 @@ def insert_artifacts_batch(artifacts: List[AIArtifact]) -> int:
         placeholders = ", ".join(["?"] * len(ARTIFACT_COLUMNS))
         cols = ", ".join(ARTIFACT_COLUMNS)
         sql = "INSERT OR IGNORE INTO artifacts ({}) VALUES ({})".format(cols, placeholders)
-        rows = []
-        for a in artifacts:
-            d = a.to_dict()
-            rows.append([d[c] for c in ARTIFACT_COLUMNS])
+        rows = [_artifact_row(a) for a in artifacts]
         conn.executemany(sql, rows)
         conn.commit()
         return len(rows)
@@ -11,7 +11,7 @@ import sys
 # Ensure the project root is on sys.path so that sibling modules resolve.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from config import APP_NAME, VERSION
+from config import APP_NAME, PERSIST_HASH_CACHE, VERSION
 import db
 
 
@@ -25,6 +25,8 @@ logger = logging.getLogger("aift")
 def _cmd_collect(args: argparse.Namespace) -> None:
     """Run collection (or dry-run detection)."""
     from collectors import get_all_collectors, get_detected_collectors
+    from collectors.base import HASH_CACHE
+    from collectors.mixins import clear_missing_paths
     from schema import CollectionRun
     from datetime import datetime, timezone
 
@@ -42,6 +44,7 @@ def _cmd_collect(args: argparse.Namespace) -> None:
             print("  [not found] {}".format(c.name))
         return
 
+    clear_missing_paths()
     detected = get_detected_collectors()
     if not detected:
         print("No collectors detected on this system.")
@@ -52,6 +55,9 @@ def _cmd_collect(args: argparse.Namespace) -> None:
     errors = []
     collector_names = []
 
+    persist_hashes = args.hash_cache or PERSIST_HASH_CACHE
+    if persist_hashes:
+        HASH_CACHE.load()
     for collector in detected:
         collector_names.append(collector.name)
         try:
@@ -65,6 +71,8 @@ def _cmd_collect(args: argparse.Namespace) -> None:
             print("  {} - ERROR: {}".format(collector.name, exc))
             if args.verbose:
                 logger.exception("Collector %s failed", collector.name)
+    if persist_hashes:
+        HASH_CACHE.save()
 
     if all_artifacts:
         count = db.insert_artifacts_batch(all_artifacts)
@@ -231,6 +239,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--dry-run", action="store_true",
         help="Detect collectors without collecting",
     )
+    sp_collect.add_argument(
+        "--hash-cache", action="store_true",
+        help="Reuse file digests saved by earlier runs (and save this run's)",
+    )
 
     # browse
     sp_browse = subparsers.add_parser("browse", help="Browse collected artifacts")
@@ -1,11 +1,24 @@
 """AIFT normalizer: timestamp normalization, content sanitization, model extraction."""
 
+import json
 import re
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from config import CREDENTIAL_PATTERNS, MODEL_PATTERNS, CONTENT_PREVIEW_MAX
 
+# Byte-level twins of CREDENTIAL_PATTERNS for sanitize_bytes()
+_CREDENTIAL_PATTERNS_BYTES = [
+    re.compile(p.pattern.encode("ascii"), p.flags & ~re.UNICODE)
+    for p in CREDENTIAL_PATTERNS
+]
+
+# Optional C JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Epoch offsets
 CHROME_EPOCH_OFFSET = 11644473600  # seconds between 1601-01-01 and 1970-01-01
 COCOA_EPOCH_OFFSET = 978307200     # seconds between 2001-01-01 and 1970-01-01
@@ -94,6 +107,76 @@ def sanitize_content(text: str) -> str:
     return result
 
 
+def json_dumps_bytes(obj: Any, default: Callable[[Any], Any] = str) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed.
+
+    The stdlib fallback emits the same compact, non-ASCII-escaped form so
+    collected content does not depend on which encoder is available; only
+    non-finite floats (null vs NaN) and some exponents (1e-7 vs 1e-07)
+    are spelled differently.
+    default converts values JSON cannot represent; datetimes are passed
+    to it too, as the stdlib does, rather than encoded natively by orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=default, option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            # Non-string keys, oversized ints, etc.
+            pass
+    return json.dumps(
+        obj, default=default, ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def json_dumps(obj: Any, default: Callable[[Any], Any] = str) -> str:
+    """Serialize to compact JSON text; see json_dumps_bytes()."""
+    return json_dumps_bytes(obj, default).decode("utf-8")
+
+
+def sanitize_bytes(data: bytes) -> bytes:
+    """Redact credential patterns from UTF-8 encoded content."""
+    if not data:
+        return data
+    for pattern in _CREDENTIAL_PATTERNS_BYTES:
+        data = pattern.sub(b"[REDACTED]", data)
+    return data
+
+
+def contains_credentials_bytes(data: bytes) -> bool:
+    """Return True if UTF-8 encoded content matches a credential pattern."""
+    if not data:
+        return False
+    for pattern in _CREDENTIAL_PATTERNS_BYTES:
+        if pattern.search(data):
+            return True
+    return False
+
+
+def plist_json_default(obj: Any) -> Any:
+    """JSON default hook for plist values: summarize data blobs, str() the rest.
+
+    Pass as default= to json_dumps() or sanitize_json(), so a parsed plist
+    is encoded in the same pass that walks it instead of first being copied
+    into a JSON-safe tree.  Matches OpenAIDataMixin._plist_to_json_safe().
+    """
+    if isinstance(obj, bytes):
+        if len(obj) <= 64:
+            return "<binary:{}>".format(obj.hex())
+        return "<binary:{}... ({} bytes)>".format(obj[:32].hex(), len(obj))
+    return str(obj)
+
+
+def sanitize_json(obj: Any, default: Callable[[Any], Any] = str) -> str:
+    """Serialize obj to compact JSON and redact credentials.
+
+    Redaction runs on the encoder's bytes output, so the document is
+    decoded to str only once.
+    """
+    return sanitize_bytes(json_dumps_bytes(obj, default)).decode("utf-8", errors="replace")
+
+
 def content_preview(text: str, max_len: int = CONTENT_PREVIEW_MAX) -> str:
     """Truncate text to preview length with sanitization."""
     if not text:
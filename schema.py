@@ -1,12 +1,18 @@
 """AIFT data models: AIArtifact and CollectionRun dataclasses."""
 
 import hashlib
+import sys
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 
+# __slots__ for per-artifact dataclasses where supported (Python 3.10+);
+# collection creates one instance per file or message
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}  # type: Dict[str, Any]
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -38,7 +44,7 @@ def _deterministic_id(
     return hashlib.sha256(key).hexdigest()[:32]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIArtifact:
     """A single forensic artifact from an AI tool."""
     source_tool: str
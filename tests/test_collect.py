@@ -0,0 +1,498 @@
+"""Tests for collector collect() runs over temporary artifact trees."""
+
+import hashlib
+import json
+import os
+import plistlib
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import collectors.mixins
+import collectors.openai_atlas
+import collectors.tabnine
+from collectors.jan import JanCollector
+from collectors.msty import MstyCollector
+from collectors.notion import NotionCollector
+from collectors.openai_atlas import OpenAIAtlasCollector
+from collectors.pieces import PiecesCollector
+from collectors.raycast import RaycastCollector
+from collectors.tabnine import TabnineCollector
+
+_UUID = "0123abcd-4567-89ab-cdef-0123456789ab"
+
+
+def _by_type(artifacts, artifact_type):
+    return [a for a in artifacts if a.artifact_type == artifact_type]
+
+
+def _write(path, content):
+    """Write str or bytes content to path, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+    return path
+
+
+def _sha256(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.fixture
+def outside(tmp_path):
+    """A directory outside the collector root, reached only via symlinks."""
+    path = tmp_path / "outside"
+    _write(path / "tabs.plist", plistlib.dumps([{"title": "x", "url": "u"}]))
+    _write(path / "profile.json", '{"leak": true}')
+    _write(path / "snippets.json", "[1, 2]")
+    _write(path / "Settings.json", '{"leak": true}')
+    _write(path / "package.json", '{"name": "linked"}')
+    _write(path / "vault.db", b"x")
+    _write(path / "linked.json", '{"leak": true}')
+    return path
+
+
+@pytest.fixture
+def atlas(tmp_path):
+    """An OpenAIAtlasCollector rooted at an empty temp directory."""
+    collector = OpenAIAtlasCollector()
+    collector._root = str(tmp_path / "atlas")
+    (tmp_path / "atlas").mkdir()
+    return collector
+
+
+class TestAtlasCollect:
+    """OpenAIAtlasCollector.collect() over a nested tree."""
+
+    def test_collect(self, atlas, tmp_path, outside):
+        root = tmp_path / "atlas"
+        tabs = _write(root / "tabs.plist", plistlib.dumps([
+            {"title": "Docs", "url": "https://example.com/docs", "date": "2024-01-01"},
+        ]))
+        archived = _write(root / _UUID / "state" / "archived-tabs.plist", plistlib.dumps(
+            {"archivedTabs": [{"title": "Old", "URL": "https://example.com/old"}]},
+            fmt=plistlib.FMT_XML,
+        ))
+        _write(root / "broken" / "tabs.plist", b"bplist00garbage")
+        profile = _write(root / _UUID / "profile.json", json.dumps(
+            {"email": "a@example.com", "password": "hunter2"},
+        ))
+        _write(root / "user.json", "{not json")
+        statsig = _write(root / "statsig" / "cache.json", '{"gate": true}')
+        _write(root / _UUID / "chat.data", b"\x00" * 10)
+        _write(root / "top.data", b"\x00" * 20)
+        os.symlink(str(outside), str(root / "linked"))
+        os.symlink(str(outside / "profile.json"), str(root / "settings.json"))
+
+        artifacts = atlas.collect()
+        assert not [a for a in artifacts if "outside" in a.file_path]
+
+        tab_artifacts = _by_type(artifacts, "tab_data")
+        assert [a.file_path for a in tab_artifacts] == [str(tabs), str(archived)]
+        first, second = tab_artifacts
+        assert first.file_hash_sha256 == _sha256(tabs)
+        assert json.loads(first.metadata)["tabs"] == [
+            {"title": "Docs", "url": "https://example.com/docs", "date": "2024-01-01"},
+        ]
+        # plistlib writes dict keys sorted
+        assert first.content_preview == (
+            '[{"date":"2024-01-01","title":"Docs","url":"https://example.com/docs"}]'
+        )
+        assert json.loads(second.metadata)["tab_count"] == 1
+        assert json.loads(second.metadata)["tabs"][0]["url"] == "https://example.com/old"
+
+        profile_artifact, = _by_type(artifacts, "profile")
+        assert profile_artifact.file_path == str(profile)
+        assert profile_artifact.file_hash_sha256 == _sha256(profile)
+        assert "hunter2" not in profile_artifact.content_preview
+        assert json.loads(profile_artifact.metadata)["relative_path"] == os.path.join(
+            _UUID, "profile.json",
+        )
+
+        analytics, = _by_type(artifacts, "analytics")
+        assert analytics.file_path == str(statsig)
+        assert analytics.content_preview == '{"gate":true}'
+        assert analytics.raw_data == '{"gate":true}'
+
+        summaries = {
+            a.file_path: json.loads(a.metadata)["file_count"]
+            for a in _by_type(artifacts, "encrypted_conversation")
+            if "file_count" in json.loads(a.metadata)
+        }
+        assert summaries == {str(root): 2, str(root / _UUID): 1}
+
+
+class TestAtlasSizeLimit:
+    """Files over MAX_FILE_READ_BYTES are inventoried, not dropped."""
+
+    def test_oversize_files_keep_metadata(self, atlas, tmp_path, monkeypatch):
+        monkeypatch.setattr(collectors.openai_atlas, "MAX_FILE_READ_BYTES", 64)
+        tabs = _write(tmp_path / "atlas" / "tabs.plist", plistlib.dumps(
+            [{"title": "t" * 100, "url": "https://example.com"}],
+        ))
+        _write(tmp_path / "atlas" / "profile.json", json.dumps({"name": "n" * 100}))
+        artifacts = atlas.collect()
+
+        tab, = _by_type(artifacts, "tab_data")
+        assert tab.file_hash_sha256 is None
+        assert tab.content_preview is None
+        assert tab.file_size_bytes == os.path.getsize(str(tabs))
+        assert json.loads(tab.metadata)["skipped_reason"] == "size_limit"
+
+        profile, = _by_type(artifacts, "profile")
+        assert profile.file_hash_sha256 is None
+        assert profile.content_preview is None
+        assert profile.raw_data is None
+        assert json.loads(profile.metadata)["skipped_reason"] == "size_limit"
+
+    def test_oversize_plist_preferences(self, atlas, tmp_path, monkeypatch):
+        monkeypatch.setattr(collectors.mixins, "MAX_FILE_READ_BYTES", 64)
+        path = tmp_path / "com.openai.chat.plist"
+        path.write_bytes(plistlib.dumps({"key": "v" * 100}))
+        preference, = atlas._collect_plist_preferences(str(path))
+        assert preference.file_hash_sha256 is None
+        assert preference.content_preview is None
+        assert preference.file_size_bytes == os.path.getsize(str(path))
+        assert json.loads(preference.metadata) == {"skipped_reason": "size_limit"}
+
+
+class TestPiecesCollect:
+    """PiecesCollector.collect() over a nested tree."""
+
+    def test_collect(self, tmp_path, outside):
+        root = tmp_path / "pieces"
+        snippets = _write(root / "snippets.json", json.dumps([
+            {"id": 1}, {"id": 2}, {"id": 3},
+        ]))
+        asset = _write(root / "db" / "Asset_index.json", json.dumps({"id": "a"}))
+        _write(root / "db" / "format_broken.json", "[1, 2,")
+        context = _write(root / "db" / "context.json", json.dumps({"anchors": []}))
+        log = _write(
+            root / "production" / "production.log",
+            "started\nkey sk-abcdefghijklmnopqrstuvwxyz1234\n",
+        )
+        os.symlink(str(outside), str(root / "linked"))
+        collector = PiecesCollector()
+        collector._root = str(root)
+
+        artifacts = collector.collect()
+        assert not [a for a in artifacts if "outside" in a.file_path]
+
+        summary, *files = _by_type(artifacts, "snippet_inventory")
+        assert summary.file_path == str(root)
+        assert summary.content_preview == "Pieces: 2 snippet files, 4 total entries"
+        assert [a.file_path for a in files] == [str(snippets), str(asset)]
+        assert [json.loads(a.metadata)["entry_count"] for a in files] == [3, 1]
+        assert files[0].file_hash_sha256 == _sha256(snippets)
+        assert files[0].content_preview == '[{"id":1},{"id":2},{"id":3}]'
+
+        context_artifact, = _by_type(artifacts, "context_metadata")
+        assert context_artifact.file_path == str(context)
+        assert json.loads(context_artifact.metadata)["relative_path"] == os.path.join(
+            "db", "context.json",
+        )
+
+        log_artifact, = _by_type(artifacts, "log")
+        assert log_artifact.file_hash_sha256 == _sha256(log)
+        assert log_artifact.content_preview.startswith("started\n")
+        assert "sk-" not in log_artifact.content_preview
+        metadata = json.loads(log_artifact.metadata)
+        assert metadata["line_count"] == 2
+        assert metadata["relative_path"] == os.path.join("production", "production.log")
+
+
+class TestRaycastCollect:
+    """RaycastCollector.collect() over a nested tree."""
+
+    def test_collect(self, tmp_path, outside):
+        root = tmp_path / "raycast"
+        _write(root / "extensions" / "ext1" / "package.json", json.dumps(
+            {"name": "ext-one", "version": "1.0"},
+        ))
+        (root / "extensions" / "ext2").mkdir()
+        os.symlink(str(outside), str(root / "extensions" / "linked"))
+        prefs = _write(root / "preferences.json", '{"theme": "dark"}')
+        settings = _write(root / "nested" / "Settings.json", '{"hotkey": "cmd"}')
+        _write(root / "nested" / "bad_settings.json", "{")
+        os.symlink(str(outside / "Settings.json"), str(root / "nested" / "link_settings.json"))
+        db = _write(root / "raycast-enc.sqlite", b"\x00" * 8)
+        os.symlink(str(outside / "vault.db"), str(root / "vault.db"))
+        collector = RaycastCollector()
+        collector._root = str(root)
+
+        artifacts = collector.collect()
+
+        inventory, = _by_type(artifacts, "extension_inventory")
+        extensions = sorted(
+            json.loads(inventory.metadata)["extensions"], key=lambda e: e["directory"],
+        )
+        assert [e["name"] for e in extensions] == ["ext-one", "ext2"]
+        assert extensions[0]["version"] == "1.0"
+
+        preferences = _by_type(artifacts, "preferences")
+        assert sorted(a.file_path for a in preferences) == sorted([str(prefs), str(settings)])
+        by_path = {a.file_path: a for a in preferences}
+        assert by_path[str(prefs)].content_preview == '{"theme":"dark"}'
+        assert by_path[str(prefs)].file_hash_sha256 == _sha256(prefs)
+
+        database, = _by_type(artifacts, "encrypted_database")
+        assert database.file_path == str(db)
+        assert database.file_hash_sha256 == _sha256(db)
+
+
+class TestTabnineCollect:
+    """TabnineCollector.collect() over a nested tree."""
+
+    def test_collect(self, tmp_path, outside, monkeypatch):
+        root = tmp_path / "tabnine"
+        monkeypatch.setattr(collectors.tabnine, "TABNINE_PATH", str(root))
+        config = _write(root / "config.json", '{"version": "4.0"}')
+        log = _write(root / "logs" / "tabnine.log", "boot\n")
+        broken = _write(root / "state" / "broken.json", "{oops")
+        _write(root / "auth.json", '{"token": "secret"}')
+        _write(root / "notes.txt", "ignored")
+        os.symlink(str(outside / "linked.json"), str(root / "linked.json"))
+
+        artifacts = TabnineCollector().collect()
+
+        by_path = {a.file_path: a for a in artifacts}
+        assert sorted(by_path) == sorted([str(config), str(log), str(broken)])
+        assert by_path[str(config)].artifact_type == "extension_data"
+        assert by_path[str(config)].content_preview == '{"version":"4.0"}'
+        assert by_path[str(config)].file_hash_sha256 == _sha256(config)
+        assert by_path[str(log)].artifact_type == "log_file"
+        assert json.loads(by_path[str(log)].metadata)["relative_path"] == os.path.join(
+            "logs", "tabnine.log",
+        )
+        # Unparseable JSON is kept as text
+        assert by_path[str(broken)].content_preview == "{oops"
+
+
+class TestNotionCollect:
+    """NotionCollector SQLite cache row counts."""
+
+    def _make_db(self, path, without_rowid_only=False):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE pages (k TEXT PRIMARY KEY) WITHOUT ROWID")
+        conn.executemany("INSERT INTO pages VALUES (?)", [("a",), ("b",)])
+        if not without_rowid_only:
+            conn.execute("CREATE TABLE blocks (v TEXT)")
+            conn.executemany("INSERT INTO blocks VALUES (?)", [("x",)] * 5)
+            conn.execute("DELETE FROM blocks WHERE rowid = 2")
+        conn.commit()
+        conn.close()
+
+    def test_row_count_methods(self, tmp_path):
+        root = tmp_path / "notion"
+        self._make_db(root / "notion.db")
+        self._make_db(root / "exact" / "pages.db", without_rowid_only=True)
+        collector = NotionCollector()
+        collector._root = str(root)
+
+        by_name = {
+            json.loads(a.metadata)["database_name"]: a
+            for a in _by_type(collector.collect(), "sqlite_data")
+        }
+        estimated = by_name["notion.db"]
+        metadata = json.loads(estimated.metadata)
+        # MAX(rowid) still counts the deleted row
+        assert metadata["table_row_counts"] == {"blocks": 5, "pages": 2}
+        assert metadata["row_count_methods"] == {"blocks": "max_rowid", "pages": "count"}
+        assert estimated.content_preview == (
+            "Notion cache DB notion.db: 2 tables, ~7 rows (max rowid)"
+        )
+
+        exact = by_name["pages.db"]
+        assert json.loads(exact.metadata)["row_count_methods"] == {"pages": "count"}
+        assert exact.content_preview == "Notion cache DB pages.db: 1 tables, 2 total rows"
+
+
+class TestJanCollect:
+    """JanCollector.collect() over a temp Jan data folder."""
+
+    @pytest.fixture
+    def jan(self, tmp_path):
+        root = tmp_path / "jan"
+        root.mkdir()
+        collector = JanCollector()
+        collector._root = str(root)
+        return collector, root
+
+    def test_threads(self, jan, outside):
+        collector, root = jan
+        threads = root / "threads"
+        meta = _write(threads / "t1" / "thread.json", '{"title": "Plan trip", "model": "llama3"}')
+        messages = [{"content": "m{}".format(i)} for i in range(5)]
+        _write(threads / "t1" / "messages.json", json.dumps(messages))
+        _write(threads / "top.json", '{"name": "loose"}')
+        _write(threads / ".git" / "t1.json", '{"title": "pruned"}')
+        _write(threads / "t1" / "notes.txt", "not json")
+        os.symlink(str(outside / "secret.json"), str(threads / "t1" / "link.json"))
+
+        artifacts = collector.collect()
+
+        convos = {
+            json.loads(a.metadata)["relative_path"]: a
+            for a in _by_type(artifacts, "conversation")
+        }
+        assert sorted(convos) == [
+            os.path.join("t1", "messages.json"),
+            os.path.join("t1", "thread.json"),
+            "top.json",
+        ]
+        thread = convos[os.path.join("t1", "thread.json")]
+        assert thread.file_path == str(meta)
+        assert thread.file_hash_sha256 == _sha256(meta)
+        assert thread.conversation_id == "t1"
+        assert thread.model_identified == "llama3"
+        assert thread.content_preview == "Plan trip"
+        assert json.loads(thread.metadata)["filename"] == "thread.json"
+        msgs = convos[os.path.join("t1", "messages.json")]
+        assert json.loads(msgs.metadata)["message_count"] == 5
+        assert msgs.content_preview == "m0 m1 m2"
+        assert convos["top.json"].conversation_id == "threads"
+        assert convos["top.json"].content_preview == "loose"
+
+    def test_app_log(self, jan):
+        collector, root = jan
+        log = _write(
+            root / "logs" / "app.log", "started\napi key sk-abcdefghijklmnopqrstuvwxyz123456\n"
+        )
+
+        log_artifact, = _by_type(collector.collect(), "log")
+
+        assert log_artifact.file_hash_sha256 == _sha256(log)
+        assert log_artifact.content_preview.startswith("started\napi key ")
+        assert "sk-abcdefghijklmnopqrstuvwxyz123456" not in log_artifact.content_preview
+        assert log_artifact.raw_data == log_artifact.content_preview
+        assert json.loads(log_artifact.metadata)["log_size_bytes"] == os.path.getsize(str(log))
+
+    def test_symlinked_models_root(self, tmp_path):
+        external = tmp_path / "external"
+        _write(external / "llama" / "model.gguf", b"x")
+        config = _write(external / "llama" / "model.json", '{"a": 1}')
+        root = tmp_path / "jan"
+        root.mkdir()
+        os.symlink(str(external), str(root / "models"))
+        collector = JanCollector()
+        collector._root = str(root)
+
+        artifacts = collector.collect()
+
+        inventory, = _by_type(artifacts, "model_inventory")
+        assert inventory.content_preview.startswith("Jan: 2 model files")
+        model_config, = _by_type(artifacts, "model_config")
+        assert model_config.file_path == str(root / "models" / "llama" / "model.json")
+        assert model_config.file_hash_sha256 == _sha256(config)
+        assert model_config.content_preview == '{"a":1}'
+
+
+class TestMstyCollect:
+    """MstyCollector.collect() over the four layouts of its single walk."""
+
+    @pytest.fixture
+    def msty(self, tmp_path):
+        root = tmp_path / "Msty"
+        _write(
+            root / "chats" / "c1.json", '{"title": "Chat one", "messages": [{"content": "hi"}]}'
+        )
+        _write(root / "chats" / "config.json", '{"model": "llama3"}')
+        _write(root / "notes" / "llm.json", '{"provider": "ollama"}')
+        _write(root / "top.json", '[{"content": "loose"}]')
+        collector = MstyCollector()
+        collector._root = str(root)
+        return collector, root
+
+    @staticmethod
+    def _summary(artifacts, artifact_type):
+        metadata = [json.loads(a.metadata) for a in _by_type(artifacts, artifact_type)]
+        return sorted((m["relative_path"], m.get("source_directory")) for m in metadata)
+
+    def test_chat_dirs_and_models_dir(self, msty):
+        collector, root = msty
+        _write(root / "models" / "m.gguf", b"x")
+
+        artifacts = collector.collect()
+
+        assert self._summary(artifacts, "conversation") == [
+            (os.path.join("chats", "c1.json"), "chats"),
+            (os.path.join("chats", "config.json"), "chats"),
+        ]
+        assert _by_type(artifacts, "model_config") == []
+        inventory, = _by_type(artifacts, "model_inventory")
+        assert inventory.content_preview.startswith("Msty: 1 model files")
+
+    def test_chat_dirs_without_models_dir(self, msty, monkeypatch):
+        collector, root = msty
+        _write(root / "models-cache" / "chat.json", '{"title": "not a chat"}')
+        loads = []
+        load = collector._load_json_file
+
+        def counting_load(entry):
+            loads.append(entry.path)
+            return load(entry)
+
+        monkeypatch.setattr(collector, "_load_json_file", counting_load)
+
+        artifacts = collector.collect()
+
+        assert self._summary(artifacts, "conversation") == [
+            (os.path.join("chats", "c1.json"), "chats"),
+            (os.path.join("chats", "config.json"), "chats"),
+        ]
+        assert self._summary(artifacts, "model_config") == [
+            (os.path.join("chats", "config.json"), None),
+            (os.path.join("notes", "llm.json"), None),
+        ]
+        # chats/config.json is both a chat and a model config but read once
+        assert len(loads) == len(set(loads)) == 3
+        conversation, = [
+            a for a in _by_type(artifacts, "conversation") if a.file_path.endswith("c1.json")
+        ]
+        assert conversation.content_preview == "[Chat one] hi"
+
+    def test_root_with_models_dir(self, tmp_path):
+        root = tmp_path / "Msty"
+        _write(root / "top.json", '[{"content": "loose"}]')
+        _write(root / "notes" / "llm.json", '{"provider": "ollama"}')
+        _write(root / "models" / "config.json", '{"model": "llama3"}')
+        collector = MstyCollector()
+        collector._root = str(root)
+
+        artifacts = collector.collect()
+
+        assert self._summary(artifacts, "conversation") == [
+            (os.path.join("notes", "llm.json"), "root"),
+            ("top.json", "root"),
+        ]
+        # Only the inventory's own config, not a walk of the root
+        model_config, = _by_type(artifacts, "model_config")
+        assert model_config.file_path == str(root / "models" / "config.json")
+        assert len(_by_type(artifacts, "model_inventory")) == 1
+
+    def test_root_without_models_dir(self, tmp_path):
+        root = tmp_path / "Msty"
+        top = _write(root / "top.json", '[{"content": "loose"}]')
+        _write(root / "notes" / "llm.json", '{"provider": "ollama"}')
+        _write(root / "models-cache" / "settings.json", '{"theme": "dark"}')
+        collector = MstyCollector()
+        collector._root = str(root)
+
+        artifacts = collector.collect()
+
+        assert self._summary(artifacts, "conversation") == [
+            (os.path.join("notes", "llm.json"), "root"),
+            ("top.json", "root"),
+        ]
+        assert self._summary(artifacts, "model_config") == [
+            (os.path.join("models-cache", "settings.json"), None),
+            (os.path.join("notes", "llm.json"), None),
+        ]
+        loose, = [a for a in _by_type(artifacts, "conversation") if a.file_path == str(top)]
+        assert loose.content_preview == "loose"
+        assert loose.file_hash_sha256 == _sha256(top)
@@ -4,13 +4,19 @@ import hashlib
 import os
 import sys
 import tempfile
+from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
-from collectors.base import AbstractCollector
+import collectors.base
+import normalizer
+from collectors.base import AbstractCollector, HashCache
 from schema import AIArtifact
-from normalizer import normalize_timestamp, CHROME_EPOCH_OFFSET
+from normalizer import (
+    normalize_timestamp, json_dumps, json_dumps_bytes, sanitize_bytes, sanitize_content,
+    sanitize_json, contains_credentials_bytes, plist_json_default, CHROME_EPOCH_OFFSET,
+)
 from typing import List
 
 
@@ -67,6 +73,35 @@ class TestContentPreview:
         assert result.endswith("...")
 
 
+class TestPreviewSanitize:
+    """Tests for _preview_sanitize."""
+
+    def test_small_document(self, collector):
+        sanitized, raw = collector._preview_sanitize({"a": 1})
+        assert sanitized == '{"a":1}'
+        assert raw == sanitized
+
+    def test_redacts(self, collector):
+        data = {"key": "sk-abcdefghijklmnopqrstuvwxyz1234"}
+        sanitized, raw = collector._preview_sanitize(data)
+        assert "sk-" not in sanitized
+        assert raw == sanitized
+
+    def test_large_document_truncated(self, collector):
+        data = ["x" * 100] * 1000
+        sanitized, raw = collector._preview_sanitize(data, limit=1000)
+        assert raw is None
+        assert sanitized.startswith('["xxx')
+        assert len(sanitized) <= 1000 + 1024
+
+    def test_encoding_independent_of_size(self, collector):
+        head = [1e-7, float("nan"), "password: hunter2 "]
+        small, _ = collector._preview_sanitize(head)
+        large, raw = collector._preview_sanitize(head + ["x" * 100] * 1000, limit=1000)
+        assert raw is None
+        assert large.startswith(small[:-1] + ",")
+
+
 class TestIsCredentialFile:
     """Tests for _is_credential_file."""
 
@@ -101,6 +136,14 @@ class TestContainsCredentials:
         assert collector._contains_credentials("") is False
         assert collector._contains_credentials(None) is False
 
+    def test_long_token_runs(self, collector):
+        hex_token = "0123456789abcdef" * 3
+        assert sanitize_content("id=" + hex_token + " end") == "id=[REDACTED] end"
+        assert sanitize_content("ggg" + hex_token) == "ggg[REDACTED]"
+        # Runs missing a required character class are left alone
+        assert sanitize_content("abcdef" * 10) == "abcdef" * 10
+        assert collector._contains_credentials("q" * 5000) is False
+
 
 class TestHashFile:
     """Tests for _hash_file."""
@@ -115,10 +158,324 @@ class TestHashFile:
         result = collector._hash_file(str(test_file))
         assert result == expected
 
+    def test_hash_empty_file(self, collector, tmp_path):
+        test_file = tmp_path / "empty.txt"
+        test_file.write_bytes(b"")
+        assert collector._hash_file(str(test_file)) == hashlib.sha256(b"").hexdigest()
+
+    def test_hash_over_limit(self, collector, tmp_path):
+        test_file = tmp_path / "big.bin"
+        test_file.write_bytes(b"x" * 100)
+        assert collector._hash_file(str(test_file), max_bytes=10) is None
+
+    def test_hash_changes_with_content(self, collector, tmp_path):
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"first")
+        assert collector._hash_file(str(test_file)) == hashlib.sha256(b"first").hexdigest()
+        test_file.write_bytes(b"second!")
+        assert collector._hash_file(str(test_file)) == hashlib.sha256(b"second!").hexdigest()
+
     def test_hash_nonexistent_file(self, collector):
         result = collector._hash_file("/nonexistent/file.txt")
         assert result is None
 
+    def test_hash_without_file_digest(self, collector, tmp_path, monkeypatch):
+        """The pre-3.11 readinto() loop hashes files spanning several blocks."""
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        test_file = tmp_path / "multi.bin"
+        content = os.urandom(1024 * 1024 * 2 + 17)
+        test_file.write_bytes(content)
+        assert collector._hash_file(str(test_file)) == hashlib.sha256(content).hexdigest()
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+        assert collector._hash_file(str(empty)) == hashlib.sha256(b"").hexdigest()
+
+
+class TestHashCache:
+    """Tests for HashCache."""
+
+    def test_roundtrip(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"abc")
+        st = os.stat(str(f))
+        cache_path = str(tmp_path / "cache" / "hash_cache.json")
+        cache = HashCache(cache_path)
+        cache.put(str(f), st, "digest")
+        cache.save()
+        assert oct(os.stat(cache_path).st_mode & 0o777) == oct(0o600)
+
+        loaded = HashCache(cache_path)
+        loaded.load()
+        assert loaded.get(str(f), st) == "digest"
+
+    def test_stale_after_write(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"abc")
+        st = os.stat(str(f))
+        cache = HashCache()
+        cache.put(str(f), st, "digest")
+        f.write_bytes(b"abcd")
+        os.utime(str(f), ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert cache.get(str(f), os.stat(str(f))) is None
+
+    def test_hit_through_hard_link(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"abc")
+        link = tmp_path / "b.txt"
+        os.link(str(f), str(link))
+        cache = HashCache(max_entries=1)
+        cache.put(str(f), os.stat(str(f)), "digest")
+        assert cache.get(str(link), os.stat(str(link))) == "digest"
+        assert cache.get(str(f), os.stat(str(f))) == "digest"
+        f.write_bytes(b"abcd")
+        assert cache.get(str(link), os.stat(str(link))) is None
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        cache_path = tmp_path / "hash_cache.json"
+        cache_path.write_text("not json")
+        cache = HashCache(str(cache_path))
+        cache.load()
+        cache.save()
+        assert cache_path.read_text() == "not json"
+
+    def test_read_and_hash_ignores_cache(self, collector, tmp_path):
+        """The digest returned with the bytes is always computed from them."""
+        f = tmp_path / "a.json"
+        f.write_bytes(b"{}")
+        collector._hash_cache = HashCache()
+        collector._hash_cache.put(str(f), os.stat(str(f)), "stale")
+        assert collector._read_and_hash(str(f)) == (b"{}", hashlib.sha256(b"{}").hexdigest())
+        # The hash-only path still uses the cache
+        assert collector._hash_file(str(f)) == "stale"
+
+
+class TestSafeSqliteIter:
+    """Tests for _safe_sqlite_iter, _safe_sqlite_read and _safe_sqlite_read_many."""
+
+    def _make_db(self, path):
+        import sqlite3
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE t (k TEXT, v INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?, ?)", [("a", 1), ("b", 2)])
+        conn.commit()
+        conn.close()
+
+    def test_yields_dict_rows(self, collector, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        self._make_db(db_path)
+        rows = collector._safe_sqlite_iter(db_path, "SELECT k, v FROM t WHERE v > ? ORDER BY k", (0,))
+        assert list(rows) == [{"k": "a", "v": 1}, {"k": "b", "v": 2}]
+        assert collector._safe_sqlite_read(db_path, "SELECT k FROM t ORDER BY k") == [{"k": "a"}, {"k": "b"}]
+
+    def test_writes_rejected(self, collector, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        self._make_db(db_path)
+        assert list(collector._safe_sqlite_iter(db_path, "DELETE FROM t")) == []
+        assert len(collector._safe_sqlite_read(db_path, "SELECT * FROM t")) == 2
+
+    def test_missing_db(self, collector, tmp_path):
+        missing = tmp_path / "missing.db"
+        assert collector._safe_sqlite_read(str(missing), "SELECT * FROM t") == []
+        assert not missing.exists()
+
+    def test_read_many(self, collector, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        self._make_db(db_path)
+        results = collector._safe_sqlite_read_many(
+            db_path, ["SELECT COUNT(*) AS cnt FROM t", "SELECT * FROM nope", "SELECT k FROM t WHERE v = 2"],
+        )
+        assert results == [[{"cnt": 2}], [], [{"k": "b"}]]
+        assert collector._safe_sqlite_read_many(str(tmp_path / "missing.db"), ["SELECT 1"]) == [[]]
+
+
+class TestExtractLeveldbStrings:
+    """Tests for _extract_leveldb_strings."""
+
+    def test_extracts_and_filters(self, collector, tmp_path):
+        (tmp_path / "000003.log").write_bytes(
+            b"\x00" + b'{"conversation": "first entry here"}'
+            + b"\x01" + b"Bearer abcdefghijklmnopqrstuvwxyz"
+            + b"\x02" + b"short"
+            + b"\x03" + b"a plain string long enough"
+        )
+        (tmp_path / "LOCK").write_bytes(b"a plain string long enough")
+        entries = collector._extract_leveldb_strings(str(tmp_path))
+        assert entries == [
+            {
+                "source_file": "000003.log",
+                "content": '{"conversation": "first entry here"}',
+                "json_data": {"conversation": "first entry here"},
+            },
+            {"source_file": "000003.log", "content": "a plain string long enough"},
+        ]
+
+
+class TestSafeLoadsJson:
+    """Tests for _safe_loads_json / _safe_read_json."""
+
+    def test_stdlib_fallback_values(self, collector):
+        # orjson rejects these; the stdlib parse must still apply.
+        data = collector._safe_loads_json(b'{"big": 123456789012345678901234567890, "n": NaN}')
+        assert data["big"] == 123456789012345678901234567890
+        assert data["n"] != data["n"]
+
+    def test_invalid_utf8_replaced(self, collector):
+        assert collector._safe_loads_json(b'{"k": "a\xffb"}') == {"k": "a\ufffdb"}
+
+    def test_invalid_json(self, collector):
+        assert collector._safe_loads_json(b"{oops") is None
+
+    def test_read_json(self, collector, tmp_path):
+        test_file = tmp_path / "c.json"
+        test_file.write_bytes(b'{"a": [1, 2]}')
+        assert collector._safe_read_json(str(test_file)) == {"a": [1, 2]}
+        assert collector._safe_read_json(str(test_file), max_bytes=4) is None
+        assert collector._safe_read_json(str(tmp_path / "missing.json")) is None
+
+
+class TestReadBytes:
+    """Tests for _read_bytes and _safe_read_text."""
+
+    def test_reads_whole_file(self, collector, tmp_path):
+        f = tmp_path / "a.bin"
+        f.write_bytes(b"x" * 100000)
+        data, st = collector._read_bytes(str(f))
+        assert data == b"x" * 100000
+        assert st.st_size == 100000
+
+    def test_limits(self, collector, tmp_path):
+        f = tmp_path / "a.bin"
+        f.write_bytes(b"abc")
+        assert collector._read_bytes(str(f), max_bytes=2) is None
+        assert collector._read_bytes(str(f), max_bytes=3)[0] == b"abc"
+        assert collector._read_bytes(str(tmp_path)) is None
+        assert collector._read_bytes(str(tmp_path / "missing")) is None
+
+    def test_text_newlines_and_decoding(self, collector, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"a\r\nb\rc\n\xff")
+        assert collector._safe_read_text(str(f)) == "a\nb\nc\n\ufffd"
+
+
+class TestSafeIterJsonPrefix:
+    """Tests for _safe_iter_json_prefix."""
+
+    def test_array_head_and_count(self, collector, tmp_path):
+        test_file = tmp_path / "messages.json"
+        test_file.write_text('[{"content": "a"}, {"content": "b"}, 3, 4, 5]')
+        head, count = collector._safe_iter_json_prefix(str(test_file), max_items=2)
+        assert head == [{"content": "a"}, {"content": "b"}]
+        assert count == 5
+
+    def test_head_chars(self, collector, tmp_path):
+        test_file = tmp_path / "snippets.json"
+        test_file.write_text("[" + ", ".join(str(i) for i in range(1000)) + "]")
+        head, count = collector._safe_iter_json_prefix(
+            str(test_file), max_items=0, head_chars=20,
+        )
+        # "[0,1,...,9]" is the shortest head whose compact JSON passes 20
+        assert head == list(range(10))
+        assert count == 1000
+
+    def test_object(self, collector, tmp_path):
+        test_file = tmp_path / "thread.json"
+        test_file.write_text('{"title": "t", "model": "m"}')
+        head, count = collector._safe_iter_json_prefix(str(test_file))
+        assert head == {"title": "t", "model": "m"}
+        assert count == 0
+
+    def test_invalid_json(self, collector, tmp_path):
+        test_file = tmp_path / "broken.json"
+        test_file.write_text('[1, 2,')
+        assert collector._safe_iter_json_prefix(str(test_file)) is None
+
+
+class TestIterFiles:
+    """Tests for _iter_files."""
+
+    def test_walks_nested_files(self, collector, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "a.json").write_text("{}")
+        (tmp_path / "sub" / "b.txt").write_text("b")
+        (tmp_path / "sub" / "deeper" / "c.log").write_text("c")
+        names = sorted(e.name for e in collector._iter_files(str(tmp_path)))
+        assert names == ["a.json", "b.txt", "c.log"]
+
+    def test_matches_os_walk_order(self, collector, tmp_path):
+        for sub in ("x", "y", "x/z"):
+            (tmp_path / sub).mkdir()
+            (tmp_path / sub / "f.txt").write_text(sub)
+        (tmp_path / "top.txt").write_text("t")
+        expected = [
+            os.path.join(dirpath, fname)
+            for dirpath, _dirnames, filenames in os.walk(str(tmp_path))
+            for fname in filenames
+        ]
+        assert [e.path for e in collector._iter_files(str(tmp_path))] == expected
+
+    def test_skip_dirs(self, collector, tmp_path):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "package.json").write_text("{}")
+        (tmp_path / "keep.json").write_text("{}")
+        names = [e.name for e in collector._iter_files(str(tmp_path), {"node_modules"})]
+        assert names == ["keep.json"]
+
+    def test_relative_path_matches_relpath(self, collector, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "f.txt").write_text("f")
+        root = str(tmp_path)
+        for entry in collector._iter_files(root):
+            assert collector._relative_path(entry.path, root) == os.path.relpath(entry.path, root)
+        unnormalized = os.path.join(root, "sub", "..")
+        assert collector._relative_path(
+            os.path.join(root, "sub", "f.txt"), unnormalized,
+        ) == os.path.join("sub", "f.txt")
+
+    def test_skips_symlinks(self, collector, tmp_path):
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "real.txt").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        os.symlink(str(target), str(root / "linked_dir"))
+        os.symlink(str(target / "real.txt"), str(root / "linked_file.txt"))
+        assert list(collector._iter_files(str(root))) == []
+
+    def test_symlinked_root_is_followed(self, collector, tmp_path):
+        target = tmp_path / "external"
+        (target / "sub").mkdir(parents=True)
+        (target / "top.gguf").write_text("t")
+        (target / "sub" / "model.gguf").write_text("m")
+        os.symlink(str(tmp_path), str(target / "sub" / "loop"))
+        root = tmp_path / "models"
+        os.symlink(str(target), str(root))
+        paths = [e.path for e in collector._iter_files(str(root))]
+        assert paths == [
+            os.path.join(str(root), "top.gguf"),
+            os.path.join(str(root), "sub", "model.gguf"),
+        ]
+
+    def test_missing_root(self, collector):
+        assert list(collector._iter_files("/nonexistent/dir")) == []
+
+
+class TestFileMetadata:
+    """Tests for _file_metadata and _file_metadata_from_entry."""
+
+    def test_reuses_stat_result(self, collector, tmp_path):
+        test_file = tmp_path / "a.txt"
+        test_file.write_bytes(b"12345")
+        st = os.stat(str(test_file))
+        assert collector._file_metadata("/nonexistent", st)["file_size_bytes"] == 5
+
+    def test_from_entry_matches_path(self, collector, tmp_path):
+        (tmp_path / "a.txt").write_bytes(b"12345")
+        entry = next(collector._iter_files(str(tmp_path)))
+        assert collector._file_metadata_from_entry(entry) == collector._file_metadata(entry.path)
+
+    def test_missing_file(self, collector):
+        assert collector._file_metadata("/nonexistent/file")["file_size_bytes"] is None
+
 
 class TestParseChromeTimestamp:
     """Tests for _parse_chrome_timestamp."""
@@ -168,3 +525,116 @@ class TestNormalizeTimestamp:
 
     def test_none(self):
         assert normalize_timestamp(None) is None
+
+
+class TestJsonDumps:
+    """Tests for the json_dumps helper in the normalizer module."""
+
+    def test_compact_output(self):
+        assert json_dumps({"a": [1, 2], "b": "x"}) == '{"a":[1,2],"b":"x"}'
+
+    def test_non_ascii_not_escaped(self):
+        assert json_dumps({"k": "caf\u00e9"}) == '{"k":"caf\u00e9"}'
+
+    def test_non_string_keys_fall_back(self):
+        assert json_dumps({1: "a"}) == '{"1":"a"}'
+
+    def test_datetime_uses_default(self):
+        value = datetime(2024, 1, 2, 3, 4, 5)
+        assert json_dumps({"d": value}) == '{"d":"2024-01-02 03:04:05"}'
+        assert json_dumps({"b": b"\x01"}, default=lambda o: o.hex()) == '{"b":"01"}'
+
+
+class TestPlistJsonDefault:
+    """Tests for encoding plist values through plist_json_default."""
+
+    def test_binary_values_summarized(self):
+        big = bytes(range(100))
+        assert json_dumps({"s": b"\x00\x01", "big": big}, default=plist_json_default) == (
+            '{{"s":"<binary:0001>","big":"<binary:{}... (100 bytes)>"}}'.format(big[:32].hex())
+        )
+
+    def test_other_values_stringified(self):
+        value = datetime(2024, 1, 2, 3, 4, 5)
+        assert sanitize_json([value], default=plist_json_default) == '["2024-01-02 03:04:05"]'
+
+
+class TestSanitizeBytes:
+    """Tests for sanitize_bytes matching sanitize_content."""
+
+    def test_matches_str_sanitizer(self):
+        text = 'key sk-abcdefghijklmnopqrstuvwxyz1234 and "password": "hunter2"'
+        assert sanitize_bytes(text.encode()).decode() == sanitize_content(text)
+
+    def test_empty(self):
+        assert sanitize_bytes(b"") == b""
+
+    def test_contains_credentials_bytes(self, collector):
+        for text in ("plain text only", "Bearer abcdefghijklmnopqrstuvwxyz", ""):
+            assert contains_credentials_bytes(text.encode()) == collector._contains_credentials(text)
+
+
+class TestOptionalJsonModules:
+    """Results with and without the optional orjson and ijson modules."""
+
+    DOCUMENTS = [
+        b'[{"content": "caf\xc3\xa9"}, 1.5, 3, [4], null, true]',
+        b'{"title": "t", "n": {"k": [1, 2]}}',
+        b'"text"',
+        b'[]',
+        b'{"k": "a\xffb"}',
+        b'["a\xffb", 2]',
+        b'{"n": NaN}',
+        b'[123456789012345678901234567890, -9223372036854775809, 18446744073709551615]',
+        b'[1, 2,',
+        b'',
+    ]
+
+    def test_safe_loads_json(self, collector, monkeypatch):
+        installed = [repr(collector._safe_loads_json(d)) for d in self.DOCUMENTS]
+        monkeypatch.setattr(collectors.base, "orjson", None)
+        assert [repr(collector._safe_loads_json(d)) for d in self.DOCUMENTS] == installed
+
+    def test_safe_iter_json_prefix(self, collector, tmp_path, monkeypatch):
+        paths = []
+        for i, data in enumerate(self.DOCUMENTS):
+            path = tmp_path / "{}.json".format(i)
+            path.write_bytes(data)
+            paths.append(str(path))
+
+        def prefixes():
+            return [
+                repr(collector._safe_iter_json_prefix(p, max_items=2))
+                for p in paths
+            ] + [
+                repr(collector._safe_iter_json_prefix(p, max_items=0, head_chars=10))
+                for p in paths
+            ]
+
+        streamed = prefixes()
+        monkeypatch.setattr(collectors.base, "ijson", None)
+        assert prefixes() == streamed
+        monkeypatch.setattr(collectors.base, "orjson", None)
+        assert prefixes() == streamed
+
+    def test_invalid_utf8_replaced(self, collector, tmp_path, monkeypatch):
+        # orjson rejects invalid UTF-8; the stdlib parse decodes it with
+        # replacement, so both paths see the same text
+        path = tmp_path / "bad.json"
+        path.write_bytes(b'["a\xffb"]')
+        for missing in ("", "orjson", "ijson"):
+            if missing:
+                monkeypatch.setattr(collectors.base, missing, None)
+            assert collector._safe_loads_json(path.read_bytes()) == ["a\ufffdb"]
+            assert collector._safe_iter_json_prefix(str(path)) == (["a\ufffdb"], 1)
+
+    def test_json_dumps_bytes(self, monkeypatch):
+        values = [
+            {"k": "caf\u00e9", "l": [1, 2.5, 0.1, 1e16, True, None], "n": {}},
+            {1: "non-string key", "big": 2 ** 70},
+            {"d": datetime(2024, 1, 2, 3, 4, 5), "b": b"\x00\x01"},
+            ("tuple", "\u2028"),
+        ]
+        installed = [json_dumps_bytes(v, default=plist_json_default) for v in values]
+        monkeypatch.setattr(normalizer, "orjson", None)
+        assert [json_dumps_bytes(v, default=plist_json_default) for v in values] == installed
@@ -24,6 +24,8 @@ from rich.layout import Layout
 
 import db
 from collectors import get_detected_collectors
+from collectors.base import HASH_CACHE
+from collectors.mixins import clear_missing_paths
 from analyzers.timeline import build_timeline, timeline_by_day
 from analyzers.stats import (
     compute_summary_stats, compute_tool_distribution,
@@ -31,7 +33,7 @@ from analyzers.stats import (
 )
 from analyzers.export import export_csv, export_json, export_jsonl, export_report
 from schema import AIArtifact, CollectionRun
-from config import APP_NAME, VERSION
+from config import APP_NAME, PERSIST_HASH_CACHE, VERSION
 
 console = Console()
 
@@ -94,6 +96,7 @@ def _show_menu() -> str:
 def _handle_collection() -> None:
     """Run all detected collectors with a progress dashboard."""
     console.print("\n[bold]Detecting available collectors...[/]")
+    clear_missing_paths()
     collectors = get_detected_collectors()
 
     if not collectors:
@@ -113,6 +116,8 @@ def _handle_collection() -> None:
     errors = []  # type: List[str]
     collector_names = []  # type: List[str]
 
+    if PERSIST_HASH_CACHE:
+        HASH_CACHE.load()
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -149,6 +154,8 @@ def _handle_collection() -> None:
                     ),
                 )
             progress.advance(overall)
+    if PERSIST_HASH_CACHE:
+        HASH_CACHE.save()
 
     # Batch insert
     if all_artifacts: